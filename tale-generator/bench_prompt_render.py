@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the prompt rendering path.
+
+Times each stage of PromptTemplateService.render_prompt for every story type
+and language with the file-based templates, so optimization work can target
+the stage that actually dominates:
+
+- character: building the character object (validation included)
+- description: building the description data dict (uncached)
+- context: PromptTemplateService._build_context
+- render: full render_prompt (context + template execution + join)
+
+Numba/Cython are intentionally not used for this path. The workload is
+string formatting, dict lookups and Jinja template execution with no
+numeric inner loops; Numba's nopython mode cannot compile str-heavy code or
+list comprehensions (MAKE_FUNCTION / LIST_APPEND), so caching and
+precomputation are the only levers that apply here.
+
+Usage:
+    python bench_prompt_render.py
+    python bench_prompt_render.py --number 20000
+"""
+
+import argparse
+import logging
+import timeit
+from typing import Callable, Dict
+
+from src.domain.value_objects import Language
+from src.prompts.character_types import ChildCharacter, HeroCharacter, CombinedCharacter
+from src.prompts.loader import FilePromptLoader
+from src.domain.services.prompt_template_service import PromptTemplateService
+
+
+def make_child() -> ChildCharacter:
+    """Create the benchmark child character."""
+    return ChildCharacter(
+        name="Emma",
+        age_category="5-7",
+        gender="female",
+        interests=["unicorns", "space", "drawing"]
+    )
+
+
+def make_hero(language: Language) -> HeroCharacter:
+    """Create the benchmark hero character."""
+    return HeroCharacter(
+        name="Captain Wonder",
+        age=25,
+        gender="male",
+        appearance="Wears a blue cape",
+        personality_traits=["brave", "kind", "curious"],
+        strengths=["flying", "super strength"],
+        interests=["helping others", "stars"],
+        language=language
+    )
+
+
+def make_character(story_type: str, language: Language):
+    """Create a character for the given story type."""
+    if story_type == "child":
+        return make_child()
+    if story_type == "hero":
+        return make_hero(language)
+    return CombinedCharacter(
+        child=make_child(),
+        hero=make_hero(language),
+        relationship="Emma meets the legendary Captain Wonder"
+    )
+
+
+def bench(stages: Dict[str, Callable[[], object]], number: int) -> Dict[str, float]:
+    """Time each stage and return microseconds per call."""
+    return {
+        name: timeit.timeit(func, number=number) / number * 1_000_000
+        for name, func in stages.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark prompt rendering stages")
+    parser.add_argument("--number", type=int, default=5000, help="Iterations per stage")
+    args = parser.parse_args()
+
+    # Rendering logs at INFO on every call; keep it out of the timings
+    logging.disable(logging.INFO)
+
+    service = PromptTemplateService(FilePromptLoader())
+
+    print(f"{'story':<10}{'lang':<6}{'character':>12}{'description':>14}{'context':>10}{'render':>10}  (us/call)")
+    for story_type in ("child", "hero", "combined"):
+        for language in Language:
+            character = make_character(story_type, language)
+
+            def build_context():
+                return service._build_context(
+                    character=character,
+                    moral="kindness",
+                    language=language,
+                    story_length=5,
+                    word_count=750,
+                    story_type=story_type,
+                    parent_story=None,
+                    theme="adventure"
+                )
+
+            results = bench(
+                {
+                    "character": lambda: make_character(story_type, language),
+                    "description": character._build_description_data,
+                    "context": build_context,
+                    "render": lambda: service.render_prompt(
+                        character, "kindness", language, 5, story_type, theme="adventure"
+                    ),
+                },
+                args.number
+            )
+            print(
+                f"{story_type:<10}{language.value:<6}"
+                f"{results['character']:>12.2f}{results['description']:>14.2f}"
+                f"{results['context']:>10.2f}{results['render']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from src.supabase_client import SupabaseClient
 
 def check_story_types():
     """Check the distribution of story types."""
-    client = SupabaseClient()
+    client = SupabaseClient.get_instance()
     stories = client.get_all_stories()
     
     story_types = {}
@@ -6,7 +6,7 @@ from src.supabase_client import SupabaseClient
 def check_user_profiles():
     """Check if user profiles are being populated during registration."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         response = client.client.table('user_profiles').select('*').execute()
         print(f"Found {len(response.data)} user profiles")
         
@@ -116,7 +116,7 @@ def demonstrate_caching_without_redis():
     
     # Initialize Supabase client
     settings = get_settings()
-    supabase_client = SupabaseClient()
+    supabase_client = SupabaseClient.get_instance()
     
     # Create basic repository (no caching)
     hero_repo = SimpleHeroRepository(supabase_client)
@@ -153,7 +153,7 @@ def demonstrate_caching_with_redis():
     print("✅ Redis connection healthy\n")
     
     # Initialize Supabase client
-    supabase_client = SupabaseClient()
+    supabase_client = SupabaseClient.get_instance()
     
     # Create base repository
     base_hero_repo = SimpleHeroRepository(supabase_client)
@@ -208,7 +208,7 @@ def demonstrate_cache_invalidation():
         print("❌ Redis is not available.")
         return
     
-    supabase_client = SupabaseClient()
+    supabase_client = SupabaseClient.get_instance()
     
     base_hero_repo = SimpleHeroRepository(supabase_client)
     hero_strategy = HeroCacheStrategy(settings.cache)
@@ -258,7 +258,7 @@ def demonstrate_graceful_degradation():
     
     print("⚠️  Simulating Redis unavailability...\n")
     
-    supabase_client = SupabaseClient()
+    supabase_client = SupabaseClient.get_instance()
     
     base_hero_repo = SimpleHeroRepository(supabase_client)
     hero_strategy = HeroCacheStrategy(offline_settings)
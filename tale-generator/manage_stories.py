@@ -22,7 +22,7 @@ def cli():
 def list_all_stories():
     """List all stories in the database."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         stories = client.get_all_stories()
         
         if not stories:
@@ -61,7 +61,7 @@ def list_all_stories():
 def list_child_stories(child_name):
     """List all stories for a specific child."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         stories = client.get_stories_by_child(child_name)
         
         if not stories:
@@ -99,7 +99,7 @@ def list_child_stories(child_name):
 def list_language_stories(language):
     """List all stories in a specific language."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         stories = client.get_stories_by_language(language)
         
         if not stories:
@@ -143,7 +143,7 @@ def rate_story(story_id, rating):
         return
         
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         rating_request = StoryRatingRequest(rating=rating)
         updated_story = client.update_story_rating(story_id, rating_request.rating)
         
@@ -161,7 +161,7 @@ def rate_story(story_id, rating):
 def delete_story(story_id):
     """Delete a story by ID."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         deleted = client.delete_story(story_id)
         
         if deleted:
@@ -177,7 +177,7 @@ def delete_story(story_id):
 def list_all_children():
     """List all children in the database."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         children = client.get_all_children()
         
         if not children:
@@ -213,7 +213,7 @@ def list_all_children():
 def delete_child(child_id):
     """Delete a child by ID."""
     try:
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         deleted = client.delete_child(child_id)
         
         if deleted:
@@ -146,7 +146,7 @@ def main():
         logger.info("=" * 60)
         
         # Initialize client
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         
         # Select stories
         stories_by_category = select_stories_for_free(client)
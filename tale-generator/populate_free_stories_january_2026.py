@@ -319,7 +319,7 @@ def main():
         logger.info("=" * 60)
         
         # Initialize client
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         
         # Get dates for January 2026
         dates = get_january_2026_dates()
@@ -11,8 +11,10 @@ from datetime import datetime
 from src.supabase_client_async import AsyncSupabaseClient
 from src.models import StoryDB, ChildDB, Language
 from src.openrouter_client import OpenRouterClient, OpenRouterModel
-from src.prompts.builders import EnglishPromptBuilder, RussianPromptBuilder
+from src.prompts.loader import FilePromptLoader
 from src.prompts.character_types import ChildCharacter, HeroCharacter, CombinedCharacter
+from src.domain.services.prompt_template_service import PromptTemplateService
+from src.utils.age_category_utils import age_to_category
 from src.domain.entities import Hero
 from src.voice_providers.elevenlabs_provider import ElevenLabsProvider
 
@@ -96,6 +98,9 @@ GENERATE_AUDIO = False
 # Story type options
 STORY_TYPES = ["child", "hero", "combined"]
 
+# One renderer for every language; the language is passed per render
+PROMPT_RENDERER = PromptTemplateService(FilePromptLoader())
+
 
 def clean_story_content(content: str) -> str:
     """Clean story content by removing formatting markers.
@@ -122,10 +127,8 @@ def clean_story_content(content: str) -> str:
 
 
 async def create_story_prompt(child, moral, language: Language, story_type: str = "child", hero_index: int = 0):
-    """Create a language-specific prompt for story generation using the new prompt builder system."""
+    """Create a language-specific prompt for story generation from the prompt templates."""
     start_time = time.time()
-    # Select appropriate builder based on language
-    builder = EnglishPromptBuilder() if language == Language.ENGLISH else RussianPromptBuilder()
     
     if story_type == "hero":
         # Retrieve heroes from database
@@ -168,13 +171,15 @@ async def create_story_prompt(child, moral, language: Language, story_type: str
             conversion_duration = time.time() - conversion_start
             logger.info(f"Converted hero entity in {conversion_duration:.2f}s")
             
-            # Build prompt using builder pattern
+            # Render prompt from templates
             prompt_building_start = time.time()
-            prompt = (builder
-                .set_character(hero_character)
-                .set_moral(moral)
-                .set_story_length(3)
-                .build())
+            prompt = PROMPT_RENDERER.render_prompt(
+                character=hero_character,
+                moral=moral,
+                language=language,
+                story_length=3,
+                story_type="hero"
+            )
             prompt_building_duration = time.time() - prompt_building_start
             logger.info(f"Built prompt in {prompt_building_duration:.2f}s")
             
@@ -214,7 +219,7 @@ async def create_story_prompt(child, moral, language: Language, story_type: str
             child_conversion_start = time.time()
             child_character = ChildCharacter(
                 name=child['name'],
-                age=child['age'],
+                age_category=age_to_category(child['age']),
                 gender=child['gender'],
                 interests=child['interests'],
                 description=None
@@ -257,13 +262,15 @@ async def create_story_prompt(child, moral, language: Language, story_type: str
             combined_char_duration = time.time() - combined_char_start
             logger.info(f"Created combined character in {combined_char_duration:.2f}s")
             
-            # Build prompt using builder pattern
+            # Render prompt from templates
             prompt_building_start = time.time()
-            prompt = (builder
-                .set_character(combined_character)
-                .set_moral(moral)
-                .set_story_length(5)  # Combined stories are longer
-                .build())
+            prompt = PROMPT_RENDERER.render_prompt(
+                character=combined_character,
+                moral=moral,
+                language=language,
+                story_length=5,  # Combined stories are longer
+                story_type="combined"
+            )
             prompt_building_duration = time.time() - prompt_building_start
             logger.info(f"Built prompt in {prompt_building_duration:.2f}s")
             
@@ -280,7 +287,7 @@ async def create_story_prompt(child, moral, language: Language, story_type: str
         conversion_start = time.time()
         child_character = ChildCharacter(
             name=child['name'],
-            age=child['age'],
+            age_category=age_to_category(child['age']),
             gender=child['gender'],
             interests=child['interests'],
             description=None
@@ -288,13 +295,15 @@ async def create_story_prompt(child, moral, language: Language, story_type: str
         conversion_duration = time.time() - conversion_start
         logger.info(f"Converted child data to character in {conversion_duration:.2f}s")
         
-        # Build prompt using builder pattern
+        # Render prompt from templates
         prompt_building_start = time.time()
-        prompt = (builder
-            .set_character(child_character)
-            .set_moral(moral)
-            .set_story_length(3)
-            .build())
+        prompt = PROMPT_RENDERER.render_prompt(
+            character=child_character,
+            moral=moral,
+            language=language,
+            story_length=3,
+            story_type="child"
+        )
         prompt_building_duration = time.time() - prompt_building_start
         logger.info(f"Built prompt in {prompt_building_duration:.2f}s")
         
@@ -123,7 +123,7 @@ def seed_database():
         logger.info("Seeding database with children...")
         
         # Initialize Supabase client
-        client = SupabaseClient()
+        client = SupabaseClient.get_instance()
         
         # Save children to database
         saved_children = []
@@ -146,7 +146,7 @@ def seed_database():
         logger.info("Seeding database with sample stories...")
         
         # Create 10 stories by duplicating and varying the sample stories
-        seeded_stories = []
+        stories_to_save = []
         
         for i in range(10):
             # Select language
@@ -183,10 +183,12 @@ def seed_database():
                 updated_at=datetime.now().isoformat()
             )
             
-            # Save to database
-            saved_story = client.save_story(story)
-            seeded_stories.append(saved_story)
-            logger.info(f"Seeded story: {saved_story.title} for {saved_story.child_name} using {model} in {language.value}")
+            stories_to_save.append(story)
+        
+        # Save all stories to the database in one request
+        seeded_stories = client.save_stories_bulk(stories_to_save)
+        for saved_story in seeded_stories:
+            logger.info(f"Seeded story: {saved_story.title} for {saved_story.child_name} in {saved_story.language.value}")
         
         logger.info(f"Successfully seeded {len(seeded_stories)} stories!")
         
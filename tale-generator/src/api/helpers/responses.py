@@ -71,17 +71,13 @@ async def save_story(
         parent_id=parent_id,
         story_length=story_length,
         theme=theme,
+        user_id=user_id,
         created_at=now,
         updated_at=now
     )
     
-    # Add user_id
-    story_dict = story_db.model_dump()
-    story_dict['user_id'] = user_id
-    story_db_with_user = StoryDB(**story_dict)
-    
     try:
-        saved_story = await supabase_client.save_story(story_db_with_user)
+        saved_story = await supabase_client.save_story(story_db)
         logger.info(f"Story saved to database with ID: {saved_story.id}, user: {user_id}, parent_id: {parent_id}")
         return saved_story
     except Exception as e:
@@ -1,6 +1,8 @@
 """Subscription validation middleware for API endpoints."""
 
 import logging
+from dataclasses import replace
+from datetime import datetime
 from typing import Optional
 from fastapi import HTTPException, Depends, status
 from src.api.auth import AuthUser, get_current_user
@@ -57,12 +59,11 @@ class SubscriptionValidator:
                     }
                 )
             
-            # Check if monthly reset is needed
+            # Check if monthly reset is needed. The stored counter rolls over
+            # when the next story is counted, so only reset it locally here
             if self.subscription_service.needs_monthly_reset(subscription):
-                logger.info(f"Resetting monthly counter for user {user.user_id}")
-                await self.supabase_client.reset_monthly_story_count(user.user_id)
-                # Reload subscription to get updated counter
-                subscription = await self.supabase_client.get_user_subscription(user.user_id)
+                logger.info(f"Monthly counter for user {user.user_id} is from a previous month, treating it as reset")
+                subscription = replace(subscription, monthly_story_count=0, last_reset_date=datetime.now())
             
             return subscription
             
@@ -227,7 +228,6 @@ class SubscriptionValidator:
     
     def _get_reset_date(self):
         """Calculate next monthly reset date."""
-        from datetime import datetime
         current_date = datetime.now()
         if current_date.month == 12:
             return datetime(current_date.year + 1, 1, 1)
@@ -1,16 +1,43 @@
 """Prompt generation service."""
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from src.domain.entities import Child, Hero
 from src.domain.value_objects import Language, StoryLength
 from src.core.logging import get_logger
 from src.utils.age_category_utils import get_age_category_for_prompt
+from src.utils.jinja_helpers import translate_moral, translate_interests
 from src.infrastructure.persistence.models import StoryDB
 from src.prompts.character_types import ChildCharacter, HeroCharacter, CombinedCharacter
-from src.domain.services.prompt_template_service import PromptTemplateService
+
+if TYPE_CHECKING:
+    from src.domain.services.prompt_template_service import PromptTemplateService
 
 logger = get_logger("domain.prompt_service")
 
+# Relationship line for combined stories, per language
+_RELATIONSHIP_TEMPLATES = {
+    Language.ENGLISH: "{child_name} meets the legendary {hero_name}",
+    Language.RUSSIAN: "{child_name} встречает легендарного героя {hero_name}",
+}
+
+# Previous-story section for continuation prompts, per language
+_PARENT_STORY_SECTION_TEMPLATES = {
+    Language.ENGLISH: """
+Previous Story:
+Title: {title}
+Content: {parent_text}
+
+This story is a continuation of the previous one. Create a natural continuation that develops the plot and characters from the previous story. Start the new story where the previous one ended and continue the adventures.
+""",
+    Language.RUSSIAN: """
+Предыдущая история:
+Заголовок: {title}
+Содержание: {parent_text}
+
+Эта история является продолжением предыдущей. Создай естественное продолжение, которое развивает сюжет и персонажей из предыдущей истории. Начни новую историю там, где закончилась предыдущая, и продолжай приключения.
+""",
+}
+
 
 class PromptService:
     """Service for generating language-specific story prompts from templates (files) or built-in."""
@@ -26,10 +53,12 @@ class PromptService:
             prompt_loader: Loader with get_prompts(language, story_type). If set, templates are loaded from it (e.g. files).
             supabase_client: Optional; used only if prompt_loader is None (legacy DB prompts).
         """
-        self._template_service: Optional[PromptTemplateService] = None
+        self._template_service: Optional["PromptTemplateService"] = None
 
         if prompt_loader is not None:
             try:
+                # Imported lazily: it pulls in Jinja2, which the built-in prompts don't need
+                from src.domain.services.prompt_template_service import PromptTemplateService
                 self._template_service = PromptTemplateService(prompt_loader)
                 logger.info("PromptTemplateService initialized with file/loader prompts")
             except Exception as e:
@@ -38,6 +67,7 @@ class PromptService:
         elif supabase_client is not None:
             try:
                 from src.infrastructure.persistence.prompt_repository import PromptRepository
+                from src.domain.services.prompt_template_service import PromptTemplateService
                 repository = PromptRepository(supabase_client)
                 self._template_service = PromptTemplateService(repository)
                 logger.info("PromptTemplateService initialized with Supabase prompts")
@@ -75,8 +105,9 @@ class PromptService:
         if self._template_service:
             try:
                 logger.info(f"✅ Using PromptTemplateService for child prompt generation (language={language.value}, story_type=child)")
-                # Convert Child entity to ChildCharacter
-                child_character = ChildCharacter(
+                # Convert Child entity to ChildCharacter (the entity already
+                # types these fields and normalizes the age category)
+                child_character = ChildCharacter.from_trusted(
                     name=child.name,
                     age_category=child.age_category,
                     gender=child.gender.value if hasattr(child.gender, 'value') else str(child.gender),
@@ -101,10 +132,8 @@ class PromptService:
             logger.warning("⚠️ PromptTemplateService not available - using built-in methods (will include 'IMPORTANT: Start directly...' text)")
         
         # Fallback to built-in methods
-        if language == Language.RUSSIAN:
-            return self._generate_russian_child_prompt(child, moral, story_length, parent_story)
-        else:
-            return self._generate_english_child_prompt(child, moral, story_length, parent_story)
+        generate = self._CHILD_FALLBACKS.get(language, self._CHILD_FALLBACKS[Language.ENGLISH])
+        return generate(self, child, moral, story_length, parent_story)
     
     def generate_hero_prompt(
         self,
@@ -160,10 +189,8 @@ class PromptService:
                 logger.warning(f"Template service failed, falling back to built-in methods: {e}", exc_info=True)
         
         # Fallback to built-in methods
-        if hero.language == Language.RUSSIAN:
-            return self._generate_russian_hero_prompt(hero, moral, story_length, parent_story)
-        else:
-            return self._generate_english_hero_prompt(hero, moral, story_length, parent_story)
+        generate = self._HERO_FALLBACKS.get(hero.language, self._HERO_FALLBACKS[Language.ENGLISH])
+        return generate(self, hero, moral, story_length, parent_story)
     
     def generate_combined_prompt(
         self,
@@ -196,7 +223,7 @@ class PromptService:
             try:
                 logger.info(f"Using PromptTemplateService for combined prompt generation (language={language.value}, story_type=combined)")
                 # Convert Child and Hero entities to Character objects
-                child_character = ChildCharacter(
+                child_character = ChildCharacter.from_trusted(
                     name=child.name,
                     age_category=child.age_category,
                     gender=child.gender.value if hasattr(child.gender, 'value') else str(child.gender),
@@ -217,10 +244,9 @@ class PromptService:
                 )
                 
                 # Create relationship description
-                if language == Language.RUSSIAN:
-                    relationship = f"{child.name} встречает легендарного героя {hero.name}"
-                else:
-                    relationship = f"{child.name} meets the legendary {hero.name}"
+                relationship = _RELATIONSHIP_TEMPLATES.get(
+                    language, _RELATIONSHIP_TEMPLATES[Language.ENGLISH]
+                ).format(child_name=child.name, hero_name=hero.name)
                 
                 combined_character = CombinedCharacter(
                     child=child_character,
@@ -243,10 +269,8 @@ class PromptService:
                 logger.warning(f"Template service failed, falling back to built-in methods: {e}", exc_info=True)
         
         # Fallback to built-in methods
-        if language == Language.RUSSIAN:
-            return self._generate_russian_combined_prompt(child, hero, moral, story_length, parent_story)
-        else:
-            return self._generate_english_combined_prompt(child, hero, moral, story_length, parent_story)
+        generate = self._COMBINED_FALLBACKS.get(language, self._COMBINED_FALLBACKS[Language.ENGLISH])
+        return generate(self, child, hero, moral, story_length, parent_story)
     
     def _generate_english_child_prompt(
         self,
@@ -437,60 +461,18 @@ class PromptService:
         
         title = parent_story.title or "Untitled Story"
         
-        if language == Language.RUSSIAN:
-            return f"""
-Предыдущая история:
-Заголовок: {title}
-Содержание: {parent_text}
-
-Эта история является продолжением предыдущей. Создай естественное продолжение, которое развивает сюжет и персонажей из предыдущей истории. Начни новую историю там, где закончилась предыдущая, и продолжай приключения.
-"""
-        else:
-            return f"""
-Previous Story:
-Title: {title}
-Content: {parent_text}
-
-This story is a continuation of the previous one. Create a natural continuation that develops the plot and characters from the previous story. Start the new story where the previous one ended and continue the adventures.
-"""
+        template = _PARENT_STORY_SECTION_TEMPLATES.get(
+            language, _PARENT_STORY_SECTION_TEMPLATES[Language.ENGLISH]
+        )
+        return template.format(title=title, parent_text=parent_text)
     
     def _translate_moral(self, moral: str, language: Language) -> str:
         """Translate moral value to target language."""
-        translations = {
-            Language.RUSSIAN: {
-                "kindness": "доброта",
-                "honesty": "честность",
-                "bravery": "храбрость",
-                "friendship": "дружба",
-                "perseverance": "настойчивость",
-                "empathy": "сочувствие",
-                "respect": "уважение",
-                "responsibility": "ответственность"
-            }
-        }
-        return translations.get(language, {}).get(moral.lower(), moral)
+        return translate_moral(moral, language)
     
     def _translate_interests(self, interests: List[str], language: Language) -> List[str]:
         """Translate interests to target language."""
-        translations = {
-            Language.RUSSIAN: {
-                "dinosaurs": "динозавры",
-                "space": "космос",
-                "robots": "роботы",
-                "unicorns": "единороги",
-                "fairies": "феи",
-                "princesses": "принцессы",
-                "cats": "кошки",
-                "flowers": "цветы",
-                "dancing": "танцы",
-                "aliens": "пришельцы",
-                "planets": "планеты",
-                "trucks": "грузовики"
-            }
-        }
-        
-        interest_map = translations.get(language, {})
-        return [interest_map.get(interest.lower(), interest) for interest in interests]
+        return translate_interests(interests, language)
     
     def _generate_english_combined_prompt(
         self,
@@ -593,3 +575,18 @@ This story is a continuation of the previous one. Create a natural continuation
         
         ВАЖНО: Начни сразу со сказки. Не включай вводный текст, объяснения или метаданные. Просто напиши заголовок и содержание сказки.
         """
+
+    # Built-in fallback generators per language, looked up instead of
+    # branching on every call (English is the default)
+    _CHILD_FALLBACKS = {
+        Language.ENGLISH: _generate_english_child_prompt,
+        Language.RUSSIAN: _generate_russian_child_prompt,
+    }
+    _HERO_FALLBACKS = {
+        Language.ENGLISH: _generate_english_hero_prompt,
+        Language.RUSSIAN: _generate_russian_hero_prompt,
+    }
+    _COMBINED_FALLBACKS = {
+        Language.ENGLISH: _generate_english_combined_prompt,
+        Language.RUSSIAN: _generate_russian_combined_prompt,
+    }
@@ -1,10 +1,16 @@
 """Service for rendering prompt templates using Jinja2."""
 
-from typing import Optional, Dict, Any, Protocol
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, List, Protocol, Tuple
 from jinja2 import Environment, Template
 from jinja2.sandbox import SandboxedEnvironment
 from src.domain.value_objects import Language
-from src.prompts.character_types.base import BaseCharacter
+from src.prompts.character_types.base import (
+    BaseCharacter,
+    CHARACTER_TYPE_CHILD,
+    CHARACTER_TYPE_HERO,
+    CHARACTER_TYPE_COMBINED,
+)
 from src.infrastructure.persistence.models import StoryDB, PromptDB
 from src.utils.jinja_helpers import register_jinja_filters
 from src.core.logging import get_logger
@@ -12,6 +18,36 @@ from src.core.constants import READING_SPEED_WPM
 
 logger = get_logger("domain.prompt_template_service")
 
+# Word counts for every story length the API accepts (1-30 minutes)
+_WORD_COUNTS: Dict[int, int] = {
+    minutes: minutes * READING_SPEED_WPM for minutes in range(1, 31)
+}
+
+# Most compiled templates kept per service; prompts edited in the database
+# produce new template sources, so old ones are evicted least recently used
+_MAX_RENDERERS = 256
+
+# Template variables copied as-is from combined character description data
+_COMBINED_CONTEXT_KEYS = (
+    "child_name",
+    "age_category",
+    "child_gender",
+    "child_interests",
+    "child_interests_str",
+    "hero_name",
+    "hero_age",
+    "hero_gender",
+    "hero_appearance",
+    "hero_personality_traits",
+    "hero_strengths",
+    "hero_interests",
+    "hero_personality_traits_str",
+    "hero_strengths_str",
+    "hero_interests_str",
+    "relationship",
+    "merged_interests",
+)
+
 
 class PromptLoader(Protocol):
     """Protocol for loading prompt parts (file or DB)."""
@@ -40,6 +76,15 @@ class PromptTemplateService:
         )
         # Register custom filters
         register_jinja_filters(self._jinja_env)
+        # Bound Template.render methods keyed by template source (LRU, at most
+        # _MAX_RENDERERS), so each prompt part is compiled once instead of on
+        # every render
+        self._renderers: "OrderedDict[str, Callable[..., str]]" = OrderedDict()
+        # Compiled (priority, render) pairs per (language, story_type), along
+        # with the loader result they were built from
+        self._compiled_parts: Dict[
+            Tuple[Language, str], Tuple[list, Tuple[Tuple[int, Callable[..., str]], ...]]
+        ] = {}
         logger.info("PromptTemplateService initialized")
 
     def render_prompt(
@@ -68,6 +113,9 @@ class PromptTemplateService:
             
         Returns:
             Complete rendered prompt string
+            
+        Raises:
+            ValueError: If no prompts are found or the character type is unknown
         """
         # Load prompt parts from loader (files or DB)
         logger.info(f"Loading prompts: language={language.value}, story_type={story_type}")
@@ -80,7 +128,7 @@ class PromptTemplateService:
             )
         
         # Calculate word count
-        word_count = story_length * READING_SPEED_WPM
+        word_count = _WORD_COUNTS.get(story_length) or story_length * READING_SPEED_WPM
         
         # Prepare context for Jinja templates
         context = self._build_context(
@@ -94,33 +142,119 @@ class PromptTemplateService:
             theme=theme
         )
         
-        # Render each prompt part
-        rendered_parts = []
+        # Render each prompt part, keeping only non-empty results
+        rendered_parts = [
+            rendered
+            for rendered in (
+                self._render_part(priority, render, context)
+                for priority, render in self._get_compiled_parts(language, story_type, prompt_parts)
+            )
+            if rendered
+        ]
+        
+        # Combine parts with double newline (parts are already stripped)
+        final_prompt = "\n\n".join(rendered_parts)
+        
+        logger.debug(
+            f"Rendered prompt with {len(rendered_parts)} parts "
+            f"for language={language.value}, story_type={story_type}"
+        )
+        
+        return final_prompt
+    
+    def _render_part(
+        self,
+        priority: int,
+        render: Callable[..., str],
+        context: Dict[str, Any]
+    ) -> str:
+        """Render a single compiled prompt part.
+        
+        Args:
+            priority: Priority of the part (used for error logging)
+            render: Compiled render function
+            context: Jinja context
+            
+        Returns:
+            Stripped rendered text, or an empty string if rendering failed
+        """
+        try:
+            return render(**context).strip()
+        except Exception as e:
+            logger.error(
+                f"Error rendering prompt part (priority={priority}): {str(e)}",
+                exc_info=True
+            )
+            # Continue with other parts even if one fails
+            return ""
+    
+    def _get_compiled_parts(
+        self,
+        language: Language,
+        story_type: str,
+        prompt_parts: List[PromptDB]
+    ) -> Tuple[Tuple[int, Callable[..., str]], ...]:
+        """Get compiled render functions for one (language, story_type) configuration.
+        
+        The result is reused for as long as the loader keeps returning the
+        same prompt parts list (both loaders cache their results), so steady-state
+        renders skip per-part template lookups entirely. Parts that fail to
+        compile are logged and left out.
+        
+        Args:
+            language: Target language
+            story_type: Story type
+            prompt_parts: Prompt parts returned by the loader
+            
+        Returns:
+            Tuple of (priority, render) pairs in prompt part order
+        """
+        key = (language, story_type)
+        cached = self._compiled_parts.get(key)
+        if cached is not None and cached[0] is prompt_parts:
+            return cached[1]
+        
+        compiled = []
         for prompt_part in prompt_parts:
             try:
-                template = self._jinja_env.from_string(prompt_part.prompt_text)
-                rendered = template.render(**context)
-                
-                # Only add non-empty rendered parts
-                if rendered and rendered.strip():
-                    rendered_parts.append(rendered.strip())
+                compiled.append((prompt_part.priority, self._get_renderer(prompt_part.prompt_text)))
             except Exception as e:
                 logger.error(
-                    f"Error rendering prompt part (priority={prompt_part.priority}): {str(e)}",
+                    f"Error compiling prompt part (priority={prompt_part.priority}): {str(e)}",
                     exc_info=True
                 )
-                # Continue with other parts even if one fails
-                continue
         
-        # Combine parts with double newline
-        final_prompt = "\n\n".join(rendered_parts).strip()
+        result = tuple(compiled)
+        self._compiled_parts[key] = (prompt_parts, result)
+        return result
+    
+    def _get_renderer(self, prompt_text: str) -> Callable[..., str]:
+        """Get the compiled render function for a template source.
         
-        logger.debug(
-            f"Rendered prompt with {len(rendered_parts)} parts "
-            f"for language={language.value}, story_type={story_type}"
-        )
+        Parts without any Jinja markup render to their own (stripped) text,
+        so they get a render function returning that shared string instead
+        of a compiled template.
         
-        return final_prompt
+        Args:
+            prompt_text: Jinja template source
+            
+        Returns:
+            Render function taking the Jinja context as keyword arguments
+        """
+        render = self._renderers.get(prompt_text)
+        if render is not None:
+            self._renderers.move_to_end(prompt_text)
+            return render
+        
+        if "{" in prompt_text:
+            render = self._jinja_env.from_string(prompt_text).render
+        else:
+            static_text = prompt_text.strip()
+            render = lambda **context: static_text
+        self._renderers[prompt_text] = render
+        if len(self._renderers) > _MAX_RENDERERS:
+            self._renderers.popitem(last=False)
+        return render
     
     def _build_context(
         self,
@@ -147,6 +281,9 @@ class PromptTemplateService:
             
         Returns:
             Context dictionary for Jinja rendering
+            
+        Raises:
+            ValueError: If the character type is unknown
         """
         context = {
             "moral": moral,
@@ -159,45 +296,69 @@ class PromptTemplateService:
         }
         
         # Add character data based on type
-        char_data = character.get_description_data()
+        char_data = character.description_data
         char_type = char_data.get("character_type")
-        
-        if char_type == "child":
-            context["child"] = character
-            # Also add direct access to child properties for convenience
-            context["child_name"] = char_data.get("name")
-            context["age_category"] = char_data.get("age_category")
-            context["child_gender"] = char_data.get("gender")
-            context["child_interests"] = char_data.get("interests", [])
-            context["child_description"] = char_data.get("description")
-        elif char_type == "hero":
-            context["hero"] = character
-            context["hero_name"] = char_data.get("name")
-            context["hero_age"] = char_data.get("age")
-            context["hero_gender"] = char_data.get("gender")
-            context["hero_appearance"] = char_data.get("appearance")
-            context["hero_personality_traits"] = char_data.get("personality_traits", [])
-            context["hero_strengths"] = char_data.get("strengths", [])
-            context["hero_interests"] = char_data.get("interests", [])
-            context["hero_description"] = char_data.get("description")
-        elif char_type == "combined":
-            context["child"] = character.child
-            context["hero"] = character.hero
-            child_data = char_data.get("child", {})
-            hero_data = char_data.get("hero", {})
-            context["child_name"] = child_data.get("name")
-            context["age_category"] = child_data.get("age_category")
-            context["child_gender"] = child_data.get("gender")
-            context["child_interests"] = child_data.get("interests", [])
-            context["hero_name"] = hero_data.get("name")
-            context["hero_age"] = hero_data.get("age")
-            context["hero_gender"] = hero_data.get("gender")
-            context["hero_appearance"] = hero_data.get("appearance")
-            context["hero_personality_traits"] = hero_data.get("personality_traits", [])
-            context["hero_strengths"] = hero_data.get("strengths", [])
-            context["hero_interests"] = hero_data.get("interests", [])
-            context["relationship"] = char_data.get("relationship")
-            context["merged_interests"] = char_data.get("merged_interests", [])
+        try:
+            add_character_context = self._CHARACTER_CONTEXT_BUILDERS[char_type]
+        except KeyError:
+            raise ValueError(f"Unknown character type: {char_type}") from None
+        add_character_context(context, character, char_data)
         
         return context
-
+    
+    @staticmethod
+    def _add_child_context(
+        context: Dict[str, Any],
+        character: BaseCharacter,
+        char_data: Dict[str, Any]
+    ) -> None:
+        """Add child character variables to the Jinja context."""
+        context["child"] = character
+        # Also add direct access to child properties for convenience
+        context["child_name"] = char_data.get("name")
+        context["age_category"] = char_data.get("age_category")
+        context["child_gender"] = char_data.get("gender")
+        context["child_interests"] = char_data.get("interests", [])
+        context["child_interests_str"] = char_data.get("interests_str", "")
+        context["child_description"] = char_data.get("description")
+    
+    @staticmethod
+    def _add_hero_context(
+        context: Dict[str, Any],
+        character: BaseCharacter,
+        char_data: Dict[str, Any]
+    ) -> None:
+        """Add hero character variables to the Jinja context."""
+        context["hero"] = character
+        context["hero_name"] = char_data.get("name")
+        context["hero_age"] = char_data.get("age")
+        context["hero_gender"] = char_data.get("gender")
+        context["hero_appearance"] = char_data.get("appearance")
+        context["hero_personality_traits"] = char_data.get("personality_traits", [])
+        context["hero_strengths"] = char_data.get("strengths", [])
+        context["hero_interests"] = char_data.get("interests", [])
+        context["hero_personality_traits_str"] = char_data.get("personality_traits_str", "")
+        context["hero_strengths_str"] = char_data.get("strengths_str", "")
+        context["hero_interests_str"] = char_data.get("interests_str", "")
+        context["hero_description"] = char_data.get("description")
+    
+    @staticmethod
+    def _add_combined_context(
+        context: Dict[str, Any],
+        character: BaseCharacter,
+        char_data: Dict[str, Any]
+    ) -> None:
+        """Add combined (child + hero) character variables to the Jinja context."""
+        context["child"] = character.child
+        context["hero"] = character.hero
+        # Combined description data already holds a flat view under the
+        # template variable names
+        for key in _COMBINED_CONTEXT_KEYS:
+            context[key] = char_data[key]
+    
+    # Context builders per character type, looked up instead of branching
+    _CHARACTER_CONTEXT_BUILDERS: Dict[str, Callable[..., None]] = {
+        CHARACTER_TYPE_CHILD: _add_child_context,
+        CHARACTER_TYPE_HERO: _add_hero_context,
+        CHARACTER_TYPE_COMBINED: _add_combined_context,
+    }
@@ -23,7 +23,8 @@ INSERT INTO tales.heroes (name, gender, appearance, personality_traits, interest
     ARRAY['stargazing', 'music', 'ancient history'],
     ARRAY['light manipulation', 'teleportation', 'healing'],
     'en'
-);
+)
+ON CONFLICT DO NOTHING;
 
 -- Insert Russian heroes
 INSERT INTO tales.heroes (name, gender, appearance, personality_traits, interests, strengths, language) VALUES
@@ -44,4 +45,5 @@ INSERT INTO tales.heroes (name, gender, appearance, personality_traits, interest
     ARRAY['зимние пейзажи', 'магия', 'древние руны'],
     ARRAY['управление льдом', 'телекинез', 'невидимость'],
     'ru'
-);
\ No newline at end of file
+)
+ON CONFLICT DO NOTHING;
\ No newline at end of file
@@ -0,0 +1,54 @@
+-- Migration: Add unique index on predefined heroes
+-- Description: Make hero seeding re-runnable with INSERT ... ON CONFLICT
+
+-- Ownership column (also added by supabase/migrations/013_add_user_id_to_heroes.sql)
+ALTER TABLE tales.heroes ADD COLUMN IF NOT EXISTS user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE;
+
+-- Replaced by the partial index below, which leaves user-owned heroes alone
+DROP INDEX IF EXISTS tales.heroes_name_language_user_uq;
+
+-- Remove duplicate predefined heroes left by running 002_populate_heroes_table.sql
+-- more than once, keeping the oldest row per (name, language). Stories pointing
+-- at a duplicate are moved to the kept hero first, since stories.hero_id blocks
+-- deletes; that column only exists once supabase/migrations/011 has been applied.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'tales' AND table_name = 'stories' AND column_name = 'hero_id'
+    ) THEN
+        EXECUTE '
+            WITH ranked AS (
+                SELECT id, FIRST_VALUE(id) OVER (
+                    PARTITION BY name, language
+                    ORDER BY created_at NULLS LAST, id
+                ) AS keep_id
+                FROM tales.heroes
+                WHERE user_id IS NULL
+            )
+            UPDATE tales.stories s
+            SET hero_id = ranked.keep_id
+            FROM ranked
+            WHERE s.hero_id = ranked.id
+            AND ranked.id <> ranked.keep_id';
+    END IF;
+END $$;
+
+WITH ranked AS (
+    SELECT id, FIRST_VALUE(id) OVER (
+        PARTITION BY name, language
+        ORDER BY created_at NULLS LAST, id
+    ) AS keep_id
+    FROM tales.heroes
+    WHERE user_id IS NULL
+)
+DELETE FROM tales.heroes h
+USING ranked
+WHERE h.id = ranked.id
+AND ranked.id <> ranked.keep_id;
+
+-- One predefined hero (user_id IS NULL) per name and language. User-owned
+-- heroes are not constrained, so users can reuse any name.
+CREATE UNIQUE INDEX IF NOT EXISTS heroes_predefined_name_language_uq
+    ON tales.heroes(name, language)
+    WHERE user_id IS NULL;
@@ -6,6 +6,7 @@ import logging
 import time
 import uuid
 from enum import StrEnum
+from itertools import chain
 from typing import Optional, Dict, Any, List, Type, TypeVar, Union
 from pydantic import BaseModel, Field
 import httpx
@@ -460,7 +461,7 @@ class OpenRouterClient:
         
         # Use fallback models for rate limit retries
         fallback_models = self._get_fallback_models()
-        models_to_try = [model] + fallback_models
+        models_to_try = chain((model,), fallback_models)
         
         last_exception = None
         current_retry_delay = retry_delay
@@ -933,7 +934,7 @@ class OpenRouterClient:
             # Find which model was actually used
             fallback_models = self._get_fallback_models()
             model_used = model
-            for m in [model] + fallback_models:
+            for m in chain((model,), fallback_models):
                 if m.value == model_used_str:
                     model_used = m
                     break
@@ -986,7 +987,7 @@ class OpenRouterClient:
             
             # Use fallback models for rate limit retries
             fallback_models = self._get_fallback_models()
-            models_to_try = [model] + fallback_models
+            models_to_try = chain((model,), fallback_models)
             
             last_exception = None
             current_retry_delay = retry_delay
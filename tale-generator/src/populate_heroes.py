@@ -12,14 +12,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.supabase_client import SupabaseClient
 from src.models import HeroDB
-from src.prompts import Heroes
+from src.prompts_old import Heroes
 
 
 async def populate_heroes_table():
     """Populate the heroes table with predefined heroes."""
     try:
         # Initialize Supabase client
-        supabase_client = SupabaseClient()
+        supabase_client = SupabaseClient.get_instance()
         
         print("Populating heroes table with predefined heroes...")
         
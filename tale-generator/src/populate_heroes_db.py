@@ -12,7 +12,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.supabase_client import SupabaseClient
 from src.models import HeroDB, Language
-from src.prompts import Heroes
+from src.prompts_old import Heroes
 
 
 async def populate_heroes_table():
@@ -21,7 +21,7 @@ async def populate_heroes_table():
         print("Populating heroes table with predefined heroes...")
         
         # Initialize Supabase client
-        supabase_client = SupabaseClient()
+        supabase_client = SupabaseClient.get_instance()
         
         # Get all predefined heroes
         english_heroes = Heroes.get_all_english_heroes()
@@ -1,31 +1,103 @@
 """Base character interface for prompt generation."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+from dataclasses import MISSING, fields
+from typing import Dict, Any, TypeVar
 
+CharacterT = TypeVar("CharacterT", bound="BaseCharacter")
 
-class BaseCharacter(ABC):
+# Values of the "character_type" key in get_description_data(). Shared so
+# producers and consumers use the same (interned) string objects.
+CHARACTER_TYPE_CHILD = "child"
+CHARACTER_TYPE_HERO = "hero"
+CHARACTER_TYPE_COMBINED = "combined"
+
+
+class BaseCharacter:
     """Base interface for all character types used in story generation.
-    
+
+    This is a plain base class rather than an ``abc.ABC``: characters are
+    created on every prompt build and checked with ``isinstance`` during
+    validation, and ``ABCMeta`` makes both of those slower. Subclasses must
+    override every method below.
+
     Note: Different character types use different age representations:
     - ChildCharacter uses age_category (str, e.g., '3-5')
     - HeroCharacter uses age (int)
     """
-    
-    @abstractmethod
+
+    # Empty slots so that slotted subclasses do not get a __dict__ back.
+    __slots__ = ()
+
+    @classmethod
+    def from_trusted(cls: type[CharacterT], **data: Any) -> CharacterT:
+        """Create a character from already-validated data without validating.
+
+        Use only for data that has passed the same checks before, e.g. a
+        domain entity loaded from the database. ``__post_init__`` is not
+        called, so no normalization happens either.
+
+        Args:
+            **data: Values for the character's init fields
+
+        Returns:
+            Character instance marked as validated
+
+        Raises:
+            TypeError: If a required field is missing or an unknown one is given
+        """
+        obj = cls.__new__(cls)
+        for f in fields(cls):
+            if f.init and f.name in data:
+                value = data.pop(f.name)
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                raise TypeError(f"{cls.__name__}.from_trusted() missing field '{f.name}'")
+            object.__setattr__(obj, f.name, value)
+
+        if data:
+            raise TypeError(
+                f"{cls.__name__}.from_trusted() got unexpected fields: {', '.join(data)}"
+            )
+
+        if hasattr(cls, "_validated"):
+            obj._validated = True
+        return obj
+
+    @property
+    def description_data(self) -> Dict[str, Any]:
+        """Character data for prompt rendering (see get_description_data)."""
+        return self.get_description_data()
+
     def get_description_data(self) -> Dict[str, Any]:
         """Get character data for prompt rendering.
-        
+
+        The dictionary is built once by ``_build_description_data`` and cached
+        on the instance (subclasses provide a ``_description_data`` slot), so
+        characters must not be mutated after construction.
+
         Returns:
             Dictionary containing character attributes
         """
-        ...
-    
-    @abstractmethod
+        data = self._description_data
+        if data is None:
+            data = self._description_data = self._build_description_data()
+        return data
+
+    def _build_description_data(self) -> Dict[str, Any]:
+        """Build the description dictionary returned by get_description_data.
+
+        Returns:
+            Dictionary containing character attributes
+        """
+        raise NotImplementedError
+
     def validate(self) -> None:
         """Validate character data.
-        
+
         Raises:
             ValidationError: If character data is invalid
         """
-        ...
+        raise NotImplementedError
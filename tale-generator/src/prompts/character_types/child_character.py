@@ -1,13 +1,13 @@
 """Child character type for story generation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
-from src.prompts.character_types.base import BaseCharacter
+from src.prompts.character_types.base import BaseCharacter, CHARACTER_TYPE_CHILD
 from src.core.exceptions import ValidationError
 from src.utils.age_category_utils import normalize_age_category
 
 
-@dataclass
+@dataclass(slots=True)
 class ChildCharacter(BaseCharacter):
     """Represents a child protagonist in a story."""
     
@@ -16,6 +16,10 @@ class ChildCharacter(BaseCharacter):
     gender: str
     interests: List[str]
     description: Optional[str] = None
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    _description_data: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate child character data on initialization."""
@@ -42,9 +46,11 @@ class ChildCharacter(BaseCharacter):
         
         if not self.gender or not self.gender.strip():
             raise ValidationError("Child gender cannot be empty", field="gender")
+        
+        self._validated = True
     
-    def get_description_data(self) -> Dict[str, Any]:
-        """Get child data for prompt rendering.
+    def _build_description_data(self) -> Dict[str, Any]:
+        """Build child data for prompt rendering.
         
         Returns:
             Dictionary containing child attributes for prompt building
@@ -54,6 +60,7 @@ class ChildCharacter(BaseCharacter):
             "age_category": self.age_category,
             "gender": self.gender,
             "interests": self.interests,
+            "interests_str": ", ".join(self.interests),
             "description": self.description,
-            "character_type": "child"
+            "character_type": CHARACTER_TYPE_CHILD
         }
@@ -1,20 +1,24 @@
 """Combined character type for story generation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import List, Dict, Any, Optional
-from src.prompts.character_types.base import BaseCharacter
+from src.prompts.character_types.base import BaseCharacter, CHARACTER_TYPE_COMBINED
 from src.prompts.character_types.child_character import ChildCharacter
 from src.prompts.character_types.hero_character import HeroCharacter
 from src.core.exceptions import ValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class CombinedCharacter(BaseCharacter):
     """Represents both a child and hero in the same story."""
     
     child: ChildCharacter
     hero: HeroCharacter
     relationship: Optional[str] = None
+    _description_data: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate combined character data on initialization."""
@@ -54,30 +58,55 @@ class CombinedCharacter(BaseCharacter):
                 field="hero"
             )
         
-        # Validate both characters
-        self.child.validate()
-        self.hero.validate()
+        # Both characters validate themselves on construction; only re-run
+        # validation for instances that have not been validated yet.
+        if not self.child._validated:
+            self.child.validate()
+        if not self.hero._validated:
+            self.hero.validate()
     
     def get_merged_interests(self) -> List[str]:
         """Combine interests from both child and hero.
         
         Returns:
-            List of unique interests from both characters
+            List of unique interests from both characters, child's first,
+            in their original order
         """
-        # Combine and deduplicate interests
-        combined = list(set(self.child.interests + self.hero.interests))
-        return combined
+        # dict.fromkeys dedupes while keeping insertion order, so the prompt
+        # stays stable across runs (unlike set ordering)
+        return list(dict.fromkeys(chain(self.child.interests, self.hero.interests)))
     
-    def get_description_data(self) -> Dict[str, Any]:
-        """Get combined character data for prompt rendering.
+    def _build_description_data(self) -> Dict[str, Any]:
+        """Build combined character data for prompt rendering.
+        
+        Besides the nested "child" and "hero" dicts, the result carries a
+        flat view of their fields under the template variable names
+        (child_name, hero_name, ...), so rendering copies them directly.
         
         Returns:
             Dictionary containing both child and hero attributes
         """
+        child_data = self.child.get_description_data()
+        hero_data = self.hero.get_description_data()
         return {
-            "child": self.child.get_description_data(),
-            "hero": self.hero.get_description_data(),
+            "child": child_data,
+            "hero": hero_data,
+            "child_name": child_data["name"],
+            "age_category": child_data["age_category"],
+            "child_gender": child_data["gender"],
+            "child_interests": child_data["interests"],
+            "child_interests_str": child_data["interests_str"],
+            "hero_name": hero_data["name"],
+            "hero_age": hero_data["age"],
+            "hero_gender": hero_data["gender"],
+            "hero_appearance": hero_data["appearance"],
+            "hero_personality_traits": hero_data["personality_traits"],
+            "hero_strengths": hero_data["strengths"],
+            "hero_interests": hero_data["interests"],
+            "hero_personality_traits_str": hero_data["personality_traits_str"],
+            "hero_strengths_str": hero_data["strengths_str"],
+            "hero_interests_str": hero_data["interests_str"],
             "relationship": self.relationship,
             "merged_interests": self.get_merged_interests(),
-            "character_type": "combined"
+            "character_type": CHARACTER_TYPE_COMBINED
         }
@@ -1,13 +1,13 @@
 """Hero character type for story generation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
-from src.prompts.character_types.base import BaseCharacter
+from src.prompts.character_types.base import BaseCharacter, CHARACTER_TYPE_HERO
 from src.domain.value_objects import Language
 from src.core.exceptions import ValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class HeroCharacter(BaseCharacter):
     """Represents a hero protagonist in a story."""
     
@@ -20,6 +20,10 @@ class HeroCharacter(BaseCharacter):
     interests: List[str]
     language: Language
     description: Optional[str] = None
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    _description_data: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Validate hero character data on initialization."""
@@ -64,9 +68,11 @@ class HeroCharacter(BaseCharacter):
                 "Hero must have at least one interest",
                 field="interests"
             )
+        
+        self._validated = True
     
-    def get_description_data(self) -> Dict[str, Any]:
-        """Get hero data for prompt rendering.
+    def _build_description_data(self) -> Dict[str, Any]:
+        """Build hero data for prompt rendering.
         
         Returns:
             Dictionary containing hero attributes for prompt building
@@ -79,7 +85,11 @@ class HeroCharacter(BaseCharacter):
             "personality_traits": self.personality_traits,
             "strengths": self.strengths,
             "interests": self.interests,
+            # Pre-joined lists, so templates do not re-join them on every render
+            "personality_traits_str": ", ".join(self.personality_traits),
+            "strengths_str": ", ".join(self.strengths),
+            "interests_str": ", ".join(self.interests),
             "language": self.language,
             "description": self.description,
-            "character_type": "hero"
+            "character_type": CHARACTER_TYPE_HERO
         }
@@ -1,5 +1,6 @@
 """Load prompt templates from Markdown files (Jinja2)."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -12,12 +13,61 @@ logger = get_logger("prompts.loader")
 _TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 
 
+@lru_cache(maxsize=64)
+def _read_template(path: Path, mtime_ns: int) -> str:
+    """Read a template file once per process and modification time.
+
+    The cache is shared across loader instances, so creating another
+    FilePromptLoader does not read unchanged files again. Loaders do not
+    watch for edits; ``mtime_ns`` only keeps a new loader from getting the
+    contents of a file that changed since an earlier one read it.
+    """
+    return path.read_text(encoding="utf-8").strip()
+
+
 class FilePromptLoader:
-    """Loads prompt templates from .md files. One file per (story_type, language)."""
+    """Loads prompt templates from .md files. One file per (story_type, language).
+
+    All ``{story_type}_{lang}.md`` files in the templates directory are read
+    when the loader is created, so ``get_prompts`` does no disk I/O.
+    """
 
     def __init__(self, templates_dir: Optional[Path] = None):
-        self._dir = Path(templates_dir) if templates_dir else _TEMPLATES_DIR
+        self._dir = Path(templates_dir).resolve() if templates_dir else _TEMPLATES_DIR
         self._cache: dict[str, List[PromptDB]] = {}
+        self._preload()
+
+    def _preload(self) -> None:
+        """Read every template in the templates directory into the cache."""
+        for path in sorted(self._dir.glob("*.md")):
+            story_type, sep, lang = path.stem.rpartition("_")
+            if not sep or not story_type:
+                continue
+            try:
+                language = Language(lang)
+            except ValueError:
+                continue
+
+            try:
+                text = _read_template(path, path.stat().st_mtime_ns)
+            except Exception as e:
+                logger.error(f"Failed to read {path}: {e}", exc_info=True)
+                continue
+
+            self._cache[f"{language.value}_{story_type}"] = [
+                PromptDB(
+                    id=None,
+                    priority=1,
+                    language=language.value,
+                    story_type=story_type,
+                    prompt_text=text,
+                    is_active=True,
+                    description=None,
+                )
+            ]
+            logger.debug(f"Loaded prompt template: {path.name}")
+
+        logger.info(f"Preloaded {len(self._cache)} prompt templates from {self._dir}")
 
     def get_prompts(
         self,
@@ -27,41 +77,17 @@ class FilePromptLoader:
         """Return prompt parts for the given language and story_type.
 
         Each file is one template; returned as a single part (priority=1).
-        Falls back to universal file {story_type}.md if {story_type}_{lang}.md missing.
+        Returns an empty list if there is no {story_type}_{lang}.md template.
         """
         if not story_type:
             return []
 
         key = f"{language.value}_{story_type}"
-        if key in self._cache:
-            return self._cache[key]
-
-        # Try story_type_lang.md (e.g. child_en.md, child_ru.md)
-        filename = f"{story_type}_{language.value}.md"
-        path = self._dir / filename
-
-        if not path.exists():
-            logger.warning(f"Prompt template not found: {path}")
-            self._cache[key] = []
-            return []
-
-        try:
-            text = path.read_text(encoding="utf-8").strip()
-        except Exception as e:
-            logger.error(f"Failed to read {path}: {e}", exc_info=True)
-            self._cache[key] = []
-            return []
-
-        part = PromptDB(
-            id=None,
-            priority=1,
-            language=language.value,
-            story_type=story_type,
-            prompt_text=text,
-            is_active=True,
-            description=None,
-        )
-        result = [part]
-        self._cache[key] = result
-        logger.debug(f"Loaded prompt template: {filename}")
+        result = self._cache.get(key)
+        if result is None:
+            logger.warning(
+                f"Prompt template not found: {self._dir / f'{story_type}_{language.value}.md'}"
+            )
+            # Cache the miss so it is only logged once
+            result = self._cache[key] = []
         return result
@@ -1,31 +1,155 @@
 """Language-specific prompts for story generation."""
 
-from typing import Protocol, Dict, List
+import random
+from types import MappingProxyType
+from string import Formatter
+from typing import Any, Callable, ClassVar, Protocol, Dict, List, Mapping, Optional, Sequence, Tuple
 from src.models import Language
-from dataclasses import dataclass
+from src.core.constants import READING_SPEED_WPM
+from dataclasses import dataclass, field
+from functools import lru_cache
 from abc import ABC, abstractmethod
 
 
-@dataclass
+# Translation tables for the language-specific story info classes, built
+# once at import time (read-only)
+_EN_GENDER: Mapping[str, str] = MappingProxyType({
+    "male": "male",
+    "female": "female",
+    "other": "other"
+})
+
+_EN_MORAL: Mapping[str, str] = MappingProxyType({
+    "kindness": "kindness",
+    "honesty": "honesty",
+    "bravery": "bravery",
+    "friendship": "friendship",
+    "perseverance": "perseverance",
+    "empathy": "empathy",
+    "respect": "respect",
+    "responsibility": "responsibility"
+})
+
+_RU_GENDER: Mapping[str, str] = MappingProxyType({
+    "male": "мальчик",
+    "female": "девочка",
+    "other": "ребенок"
+})
+
+_RU_MORAL: Mapping[str, str] = MappingProxyType({
+    "kindness": "доброта",
+    "honesty": "честность",
+    "bravery": "храбрость",
+    "friendship": "дружба",
+    "perseverance": "настойчивость",
+    "empathy": "сочувствие",
+    "respect": "уважение",
+    "responsibility": "ответственность"
+})
+
+_RU_INTERESTS: Mapping[str, str] = MappingProxyType({
+    "dinosaurs": "динозавры",
+    "space": "космос",
+    "robots": "роботы",
+    "unicorns": "единороги",
+    "fairies": "феи",
+    "princesses": "принцессы",
+    "cats": "кошки",
+    "flowers": "цветы",
+    "dancing": "танцы",
+    "aliens": "пришельцы",
+    "planets": "планеты",
+    "trucks": "грузовики"
+})
+
+
+@dataclass(frozen=True, slots=True)
 class Hero:
-    """Base class for story heroes."""
+    """Base class for story heroes.
+    
+    Frozen, with list fields stored as tuples, so heroes are hashable and
+    the prompt functions below can be memoized. The comma-joined traits,
+    strengths and interests used by every prompt are computed once on
+    construction (slotted instances cannot hold cached properties).
+    """
     name: str
     age: int
     gender: str
     appearance: str
-    personality_traits: List[str]
-    strengths: List[str]
-    interests: List[str]
+    personality_traits: Sequence[str]
+    strengths: Sequence[str]
+    interests: Sequence[str]
     language: Language = Language.ENGLISH
+    joined_traits: str = field(init=False, repr=False, compare=False)
+    joined_strengths: str = field(init=False, repr=False, compare=False)
+    joined_interests: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        personality_traits = tuple(self.personality_traits)
+        strengths = tuple(self.strengths)
+        interests = tuple(self.interests)
+        object.__setattr__(self, "personality_traits", personality_traits)
+        object.__setattr__(self, "strengths", strengths)
+        object.__setattr__(self, "interests", interests)
+        object.__setattr__(self, "joined_traits", ', '.join(personality_traits))
+        object.__setattr__(self, "joined_strengths", ', '.join(strengths))
+        object.__setattr__(self, "joined_interests", ', '.join(interests))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Child:
-    """Child profile for child-based stories."""
+    """Child profile for child-based stories (frozen and hashable, like Hero)."""
     name: str
     age: int
     gender: str
-    interests: List[str]
+    interests: Sequence[str]
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "interests", tuple(self.interests))
+
+
+def _word_count(story_length: int) -> int:
+    """Estimate word count based on reading speed (approx. 150 words per minute for children)."""
+    return story_length * READING_SPEED_WPM
+
+
+@lru_cache(maxsize=32)
+def _ru_moral(moral: str) -> str:
+    """Translate a moral value to Russian (case-insensitive, memoized)."""
+    return _RU_MORAL.get(moral.lower(), moral)
+
+
+# A split template: the leading static fragment, then (field name, following
+# static fragment) pairs
+_SplitTemplate = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _split_template(template: str) -> _SplitTemplate:
+    """Split a str.format template into its static fragments and field names.
+    
+    Returns:
+        (head, pairs) where pairs holds (field_name, literal) for every field
+    """
+    head = ""
+    pairs: List[Tuple[str, str]] = []
+    for literal, field_name, _, _ in Formatter().parse(template):
+        if pairs:
+            pairs[-1] = (pairs[-1][0], literal)
+        else:
+            head = literal
+        if field_name is not None:
+            pairs.append((field_name, ""))
+    return head, tuple(pairs)
+
+
+def _fill_template(template: _SplitTemplate, values: Dict[str, Any]) -> str:
+    """Fill a template produced by _split_template with a single join."""
+    head, pairs = template
+    parts = [head]
+    for field_name, literal in pairs:
+        parts.append(str(values[field_name]))
+        parts.append(literal)
+    return "".join(parts)
 
 
 class StoryPrompt(Protocol):
@@ -61,41 +185,33 @@ class StoryPrompt(Protocol):
 class LanguageStoryInfo(ABC):
     """Base class for language-specific story information."""
     
-    @property
-    @abstractmethod
-    def gender_translations(self) -> Dict[str, str]:
-        """Gender translations."""
-        ...
+    def __init__(self) -> None:
+        # Full prompt templates with every per-request value left as a
+        # str.format placeholder, built once and pre-split into static
+        # fragments so rendering is a single join
+        self._common_tmpl = _split_template(self._build_common_template())
+        self._heroic_tmpl = _split_template(self._build_heroic_template())
+        self._child_tmpl = _split_template(self._build_child_template())
     
-    @property
-    @abstractmethod
-    def moral_translations(self) -> Dict[str, str]:
-        """Moral value translations."""
-        ...
-    
-    @property
-    def interest_translations(self) -> Dict[str, str]:
-        """Interest translations (can be overridden by subclasses)."""
-        return {
-            "dinosaurs": "динозавры",
-            "space": "космос",
-            "robots": "роботы",
-            "unicorns": "единороги",
-            "fairies": "феи",
-            "princesses": "принцессы",
-            "cats": "кошки",
-            "flowers": "цветы",
-            "dancing": "танцы",
-            "aliens": "пришельцы",
-            "planets": "планеты",
-            "trucks": "грузовики"
-        }
+    # Translation tables, set by subclasses as read-only class constants
+    gender_translations: ClassVar[Mapping[str, str]]
+    moral_translations: ClassVar[Mapping[str, str]]
+    # Interest translations (can be overridden by subclasses)
+    interest_translations: ClassVar[Mapping[str, str]] = _RU_INTERESTS
     
     def get_common_story_elements(self, moral: str, word_count: int, character_instruction: str) -> str:
         """Get common story elements to reduce duplication in templates."""
-        return f'''        {self.get_moral_instruction(moral)}
-        {self.get_length_instruction(word_count)}
-        {character_instruction}
+        return _fill_template(self._common_tmpl, {
+            "moral": moral,
+            "word_count": word_count,
+            "character_instruction": character_instruction
+        })
+    
+    def _build_common_template(self) -> str:
+        """Build the common story elements template with str.format placeholders."""
+        return f'''        {self.get_moral_instruction("{moral}")}
+        {self.get_length_instruction("{word_count}")}
+        {{character_instruction}}
         {self.get_ending_instruction()}
         {self.get_language_instruction()}'''
     
@@ -119,77 +235,81 @@ class LanguageStoryInfo(ABC):
         """Get the language instruction for the story."""
         ...
     
-    @abstractmethod
     def get_heroic_story_template(self, name: str, age: int, gender: str, appearance: str, 
                                  personality_traits: str, strengths: str, interests: str, 
                                  moral: str, word_count: int) -> str:
         """Generate a heroic story template with all parameters filled in."""
-        ...
+        return _fill_template(self._heroic_tmpl, {
+            "name": name,
+            "age": age,
+            "gender": gender,
+            "appearance": appearance,
+            "personality_traits": personality_traits,
+            "strengths": strengths,
+            "interests": interests,
+            "moral": moral,
+            "word_count": word_count
+        })
     
-    @abstractmethod
     def get_child_story_template(self, name: str, age: int, gender: str, interests: str,
                                 moral: str, word_count: int) -> str:
         """Generate a child story template with all parameters filled in."""
+        return _fill_template(self._child_tmpl, {
+            "name": name,
+            "age": age,
+            "gender": gender,
+            "interests": interests,
+            "moral": moral,
+            "word_count": word_count
+        })
+    
+    @abstractmethod
+    def _build_heroic_template(self) -> str:
+        """Build the heroic story template with str.format placeholders."""
+        ...
+    
+    @abstractmethod
+    def _build_child_template(self) -> str:
+        """Build the child story template with str.format placeholders."""
         ...
 
 
 class EnglishStoryInfo(LanguageStoryInfo):
     """English story information."""
     
-    def get_heroic_story_template(self, name: str, age: int, gender: str, appearance: str, 
-                             personality_traits: str, strengths: str, interests: str, 
-                             moral: str, word_count: int) -> str:
-        """Generate a heroic story template with all parameters filled in."""
+    def _build_heroic_template(self) -> str:
+        """Build the heroic story template with str.format placeholders."""
         character_instruction = 'Include the hero\'s name as the main character in the story.'
-        common_elements = self.get_common_story_elements(moral, word_count, character_instruction)
+        common_elements = self.get_common_story_elements("{moral}", "{word_count}", character_instruction)
         return f"""
         Create a bedtime story featuring a heroic character with the following characteristics:
-        - Name: {name}
-        - Age: {age}
-        - Gender: {gender}
-        - Appearance: {appearance}
-        - Personality Traits: {personality_traits}
-        - Strengths: {strengths}
-        - Interests: {interests}
+        - Name: {{name}}
+        - Age: {{age}}
+        - Gender: {{gender}}
+        - Appearance: {{appearance}}
+        - Personality Traits: {{personality_traits}}
+        - Strengths: {{strengths}}
+        - Interests: {{interests}}
         
 {common_elements}
         """
     
-    def get_child_story_template(self, name: str, age: int, gender: str, interests: str,
-                              moral: str, word_count: int) -> str:
-        """Generate a child story template with all parameters filled in."""
+    def _build_child_template(self) -> str:
+        """Build the child story template with str.format placeholders."""
         character_instruction = 'Include the child\'s name as the main character in the story.'
-        common_elements = self.get_common_story_elements(moral, word_count, character_instruction)
+        common_elements = self.get_common_story_elements("{moral}", "{word_count}", character_instruction)
         return f"""
         Create a bedtime story for a child with the following characteristics:
-        - Name: {name}
-        - Age: {age}
-        - Gender: {gender}
-        - Interests: {interests}
+        - Name: {{name}}
+        - Age: {{age}}
+        - Gender: {{gender}}
+        - Interests: {{interests}}
         
 {common_elements}
         """
     
-    @property
-    def gender_translations(self) -> Dict[str, str]:
-        return {
-            "male": "male",
-            "female": "female",
-            "other": "other"
-        }
-    
-    @property
-    def moral_translations(self) -> Dict[str, str]:
-        return {
-            "kindness": "kindness",
-            "honesty": "honesty",
-            "bravery": "bravery",
-            "friendship": "friendship",
-            "perseverance": "perseverance",
-            "empathy": "empathy",
-            "respect": "respect",
-            "responsibility": "responsibility"
-        }
+    gender_translations = _EN_GENDER
+    moral_translations = _EN_MORAL
     
     def get_moral_instruction(self, moral: str) -> str:
         return f'The story should focus on the moral value of "{moral}" and be appropriate for children.'
@@ -207,77 +327,40 @@ class EnglishStoryInfo(LanguageStoryInfo):
 class RussianStoryInfo(LanguageStoryInfo):
     """Russian story information."""
     
-    def get_heroic_story_template(self, name: str, age: int, gender: str, appearance: str, 
-                             personality_traits: str, strengths: str, interests: str, 
-                             moral: str, word_count: int) -> str:
-        """Generate a heroic story template with all parameters filled in."""
+    def _build_heroic_template(self) -> str:
+        """Build the heroic story template with str.format placeholders."""
         character_instruction = 'Включи имя героя как главного персонажа сказки.'
-        common_elements = self.get_common_story_elements(moral, word_count, character_instruction)
+        common_elements = self.get_common_story_elements("{moral}", "{word_count}", character_instruction)
         return f"""
         Создай детскую сказку на ночь о герое со следующими характеристиками:
-        - Имя: {name}
-        - Возраст: {age}
-        - Пол: {gender}
-        - Внешность: {appearance}
-        - Черты характера: {personality_traits}
-        - Сильные стороны: {strengths}
-        - Интересы: {interests}
+        - Имя: {{name}}
+        - Возраст: {{age}}
+        - Пол: {{gender}}
+        - Внешность: {{appearance}}
+        - Черты характера: {{personality_traits}}
+        - Сильные стороны: {{strengths}}
+        - Интересы: {{interests}}
         
 {common_elements}
         """
     
-    def get_child_story_template(self, name: str, age: int, gender: str, interests: str,
-                              moral: str, word_count: int) -> str:
-        """Generate a child story template with all parameters filled in."""
+    def _build_child_template(self) -> str:
+        """Build the child story template with str.format placeholders."""
         character_instruction = 'Включи имя ребенка как главного героя сказки.'
-        common_elements = self.get_common_story_elements(moral, word_count, character_instruction)
+        common_elements = self.get_common_story_elements("{moral}", "{word_count}", character_instruction)
         return f"""
         Создай детскую сказку на ночь со следующими характеристиками:
-        - Имя: {name}
-        - Возраст: {age}
-        - Пол: {gender}
-        - Интересы: {interests}
+        - Имя: {{name}}
+        - Возраст: {{age}}
+        - Пол: {{gender}}
+        - Интересы: {{interests}}
         
 {common_elements}
         """
     
-    @property
-    def gender_translations(self) -> Dict[str, str]:
-        return {
-            "male": "мальчик",
-            "female": "девочка",
-            "other": "ребенок"
-        }
-    
-    @property
-    def moral_translations(self) -> Dict[str, str]:
-        return {
-            "kindness": "доброта",
-            "honesty": "честность",
-            "bravery": "храбрость",
-            "friendship": "дружба",
-            "perseverance": "настойчивость",
-            "empathy": "сочувствие",
-            "respect": "уважение",
-            "responsibility": "ответственность"
-        }
-    
-    @property
-    def interest_translations(self) -> Dict[str, str]:
-        return {
-            "dinosaurs": "динозавры",
-            "space": "космос",
-            "robots": "роботы",
-            "unicorns": "единороги",
-            "fairies": "феи",
-            "princesses": "принцессы",
-            "cats": "кошки",
-            "flowers": "цветы",
-            "dancing": "танцы",
-            "aliens": "пришельцы",
-            "planets": "планеты",
-            "trucks": "грузовики"
-        }
+    gender_translations = _RU_GENDER
+    moral_translations = _RU_MORAL
+    interest_translations = _RU_INTERESTS
     
     def get_moral_instruction(self, moral: str) -> str:
         return f'Сказка должна содержать нравственный урок о "{moral}" и быть подходящей для детей.'
@@ -292,13 +375,18 @@ class RussianStoryInfo(LanguageStoryInfo):
         return "Напиши сказку на русском языке."
 
 
+# Language-specific information singletons (English is the fallback)
+_LANGUAGE_INFO: Mapping[Language, LanguageStoryInfo] = MappingProxyType({
+    Language.ENGLISH: EnglishStoryInfo(),
+    Language.RUSSIAN: RussianStoryInfo()
+})
+_DEFAULT_LANGUAGE_INFO = _LANGUAGE_INFO[Language.ENGLISH]
+
+
 class PromptGenerator:
     """Base prompt generator with language-specific information."""
     
-    _language_info: Dict[Language, LanguageStoryInfo] = {
-        Language.ENGLISH: EnglishStoryInfo(),
-        Language.RUSSIAN: RussianStoryInfo()
-    }
+    _language_info: Mapping[Language, LanguageStoryInfo] = _LANGUAGE_INFO
     
     @classmethod
     def get_language_info(cls, language: Language) -> LanguageStoryInfo:
@@ -310,116 +398,154 @@ class PromptGenerator:
         Returns:
             Language-specific information
         """
-        return cls._language_info.get(language, cls._language_info[Language.ENGLISH])
+        return _LANGUAGE_INFO.get(language, _DEFAULT_LANGUAGE_INFO)
 
 
-class EnglishPromptGenerator:
-    """English story prompt generator."""
+_EN_INFO = _LANGUAGE_INFO[Language.ENGLISH]
+_RU_INFO = _LANGUAGE_INFO[Language.RUSSIAN]
+
+
+def _generate_heroic_en(hero: Hero, moral: str, story_length: int = 5) -> str:
+    """Generate an English heroic story prompt."""
+    prompt = _EN_INFO.get_heroic_story_template(
+        name=hero.name,
+        age=hero.age,
+        gender=hero.gender,
+        appearance=hero.appearance,
+        personality_traits=hero.joined_traits,
+        strengths=hero.joined_strengths,
+        interests=hero.joined_interests,
+        moral=moral,
+        word_count=_word_count(story_length)
+    )
+    
+    return prompt.strip()
+
+
+def _generate_child_en(child: Child, moral: str, story_length: int = 5) -> str:
+    """Generate an English child-based story prompt."""
+    prompt = _EN_INFO.get_child_story_template(
+        name=child.name,
+        age=child.age,
+        gender=child.gender,
+        interests=', '.join(child.interests),
+        moral=moral,
+        word_count=_word_count(story_length)
+    )
+    
+    return prompt.strip()
+
+
+def _generate_heroic_ru(hero: Hero, moral: str, story_length: int = 5) -> str:
+    """Generate a Russian heroic story prompt."""
+    prompt = _RU_INFO.get_heroic_story_template(
+        name=hero.name,
+        age=hero.age,
+        gender=_RU_GENDER.get(hero.gender, "герой"),
+        appearance=hero.appearance,
+        personality_traits=hero.joined_traits,
+        strengths=hero.joined_strengths,
+        interests=hero.joined_interests,
+        moral=_ru_moral(moral),
+        word_count=_word_count(story_length)
+    )
+    
+    return prompt.strip()
+
+
+def _generate_child_ru(child: Child, moral: str, story_length: int = 5) -> str:
+    """Generate a Russian child-based story prompt."""
+    # Translate interests to Russian if possible
+    interests_ru = ', '.join(
+        _RU_INTERESTS.get(interest.lower(), interest) for interest in child.interests
+    )
+    
+    prompt = _RU_INFO.get_child_story_template(
+        name=child.name,
+        age=child.age,
+        gender=_RU_GENDER.get(child.gender, "ребенок"),
+        interests=interests_ru,
+        moral=_ru_moral(moral),
+        word_count=_word_count(story_length)
+    )
+    
+    return prompt.strip()
+
+
+# Prompt functions per language; callers fall back to English
+_HEROIC_BY_LANG: Mapping[Language, Callable[[Hero, str, int], str]] = MappingProxyType({
+    Language.ENGLISH: _generate_heroic_en,
+    Language.RUSSIAN: _generate_heroic_ru
+})
+_CHILD_BY_LANG: Mapping[Language, Callable[[Child, str, int], str]] = MappingProxyType({
+    Language.ENGLISH: _generate_child_en,
+    Language.RUSSIAN: _generate_child_ru
+})
+
+
+class _LanguagePromptGenerator:
+    """Shared base for the language-specific prompt generators.
+    
+    The generators are thin wrappers around the module-level prompt
+    functions, kept for callers that go through PromptFactory. They
+    remember the last prompt of each kind, so back-to-back identical
+    requests (retries, previews) are returned without rendering. The last
+    hero/child is held by reference, which keeps the identity check safe;
+    both are frozen.
+    """
+    
+    _render_heroic_prompt: ClassVar[Callable[[Hero, str, int], str]]
+    _render_child_prompt: ClassVar[Callable[[Child, str, int], str]]
+    
+    def __init__(self) -> None:
+        self._last_heroic: Optional[Tuple[Hero, str, int, str]] = None
+        self._last_child: Optional[Tuple[Child, str, int, str]] = None
     
     def generate_heroic_prompt(self, hero: Hero, moral: str, story_length: int = 5) -> str:
-        """Generate an English heroic story prompt."""
-        # Estimate word count based on reading speed (approx. 150 words per minute for children)
-        word_count = story_length * 150
-        
-        info = PromptGenerator.get_language_info(Language.ENGLISH)
-        
-        prompt = info.get_heroic_story_template(
-            name=hero.name,
-            age=hero.age,
-            gender=hero.gender,
-            appearance=hero.appearance,
-            personality_traits=', '.join(hero.personality_traits),
-            strengths=', '.join(hero.strengths),
-            interests=', '.join(hero.interests),
-            moral=moral,
-            word_count=word_count
-        )
-        
-        return prompt.strip()
+        """Generate a heroic story prompt."""
+        last = self._last_heroic
+        if last is not None and last[0] is hero and last[1] == moral and last[2] == story_length:
+            return last[3]
+        prompt = self._render_heroic_prompt(hero, moral, story_length)
+        self._last_heroic = (hero, moral, story_length, prompt)
+        return prompt
     
     def generate_child_prompt(self, child: Child, moral: str, story_length: int = 5) -> str:
-        """Generate an English child-based story prompt."""
-        # Estimate word count based on reading speed (approx. 150 words per minute for children)
-        word_count = story_length * 150
-        
-        info = PromptGenerator.get_language_info(Language.ENGLISH)
-        
-        prompt = info.get_child_story_template(
-            name=child.name,
-            age_category=child.age_category,
-            gender=child.gender,
-            interests=', '.join(child.interests),
-            moral=moral,
-            word_count=word_count
-        )
-        
-        return prompt.strip()
+        """Generate a child-based story prompt."""
+        last = self._last_child
+        if last is not None and last[0] is child and last[1] == moral and last[2] == story_length:
+            return last[3]
+        prompt = self._render_child_prompt(child, moral, story_length)
+        self._last_child = (child, moral, story_length, prompt)
+        return prompt
 
 
-class RussianPromptGenerator:
-    """Russian story prompt generator."""
+class EnglishPromptGenerator(_LanguagePromptGenerator):
+    """English story prompt generator."""
     
-    def generate_heroic_prompt(self, hero: Hero, moral: str, story_length: int = 5) -> str:
-        """Generate a Russian heroic story prompt."""
-        # Estimate word count based on reading speed (approx. 150 words per minute for children)
-        word_count = story_length * 150
-        
-        info = PromptGenerator.get_language_info(Language.RUSSIAN)
-        
-        # Translate moral values to Russian
-        moral_ru = info.moral_translations.get(moral.lower(), moral)
-        
-        prompt = info.get_heroic_story_template(
-            name=hero.name,
-            age=hero.age,
-            gender=info.gender_translations.get(hero.gender, "герой"),
-            appearance=hero.appearance,
-            personality_traits=', '.join(hero.personality_traits),
-            strengths=', '.join(hero.strengths),
-            interests=', '.join(hero.interests),
-            moral=moral_ru,
-            word_count=word_count
-        )
-        
-        return prompt.strip()
+    _render_heroic_prompt = staticmethod(_generate_heroic_en)
+    _render_child_prompt = staticmethod(_generate_child_en)
+
+
+class RussianPromptGenerator(_LanguagePromptGenerator):
+    """Russian story prompt generator."""
     
-    def generate_child_prompt(self, child: Child, moral: str, story_length: int = 5) -> str:
-        """Generate a Russian child-based story prompt."""
-        # Estimate word count based on reading speed (approx. 150 words per minute for children)
-        word_count = story_length * 150
-        
-        info = PromptGenerator.get_language_info(Language.RUSSIAN)
-        
-        # Translate child profile fields to Russian
-        gender_ru = info.gender_translations.get(child.gender, "ребенок")
-        
-        # Translate moral values to Russian
-        moral_ru = info.moral_translations.get(moral.lower(), moral)
-        
-        # Translate interests to Russian if possible
-        interests_ru: List[str] = []
-        for interest in child.interests:
-            interests_ru.append(info.interest_translations.get(interest.lower(), interest))
-        
-        prompt = info.get_child_story_template(
-            name=child.name,
-            age_category=child.age_category,
-            gender=gender_ru,
-            interests=', '.join(interests_ru),
-            moral=moral_ru,
-            word_count=word_count
-        )
-        
-        return prompt.strip()
+    _render_heroic_prompt = staticmethod(_generate_heroic_ru)
+    _render_child_prompt = staticmethod(_generate_child_ru)
+
+
+# Prompt generator singletons (English is the fallback)
+_GENERATORS: Mapping[Language, StoryPrompt] = MappingProxyType({
+    Language.ENGLISH: EnglishPromptGenerator(),
+    Language.RUSSIAN: RussianPromptGenerator()
+})
+_DEFAULT_GENERATOR = _GENERATORS[Language.ENGLISH]
 
 
 class PromptFactory:
     """Factory for creating prompt generators based on language."""
     
-    _generators: Dict[Language, StoryPrompt] = {
-        Language.ENGLISH: EnglishPromptGenerator(),
-        Language.RUSSIAN: RussianPromptGenerator()
-    }
+    _generators: Mapping[Language, StoryPrompt] = _GENERATORS
     
     @classmethod
     def get_generator(cls, language: Language) -> StoryPrompt:
@@ -431,12 +557,15 @@ class PromptFactory:
         Returns:
             A prompt generator instance
         """
-        return cls._generators.get(language, cls._generators[Language.ENGLISH])
+        return _GENERATORS.get(language, _DEFAULT_GENERATOR)
 
 
+@lru_cache(maxsize=256)
 def get_heroic_story_prompt(hero: Hero, moral: str, language: Language, story_length: int = 5) -> str:
     """Get a language-specific heroic story prompt.
     
+    Memoized: the prompt depends only on the (immutable) arguments.
+    
     Args:
         hero: Hero information
         moral: The moral value for the story
@@ -446,13 +575,15 @@ def get_heroic_story_prompt(hero: Hero, moral: str, language: Language, story_le
     Returns:
         A prompt string in the specified language
     """
-    generator = PromptFactory.get_generator(language)
-    return generator.generate_heroic_prompt(hero, moral, story_length)
+    return _HEROIC_BY_LANG.get(language, _generate_heroic_en)(hero, moral, story_length)
 
 
+@lru_cache(maxsize=256)
 def get_child_story_prompt(child: Child, moral: str, language: Language, story_length: int = 5) -> str:
     """Get a language-specific child-based story prompt.
     
+    Memoized: the prompt depends only on the (immutable) arguments.
+    
     Args:
         child: Child information
         moral: The moral value for the story
@@ -462,8 +593,7 @@ def get_child_story_prompt(child: Child, moral: str, language: Language, story_l
     Returns:
         A prompt string in the specified language
     """
-    generator = PromptFactory.get_generator(language)
-    return generator.generate_child_prompt(child, moral, story_length)
+    return _CHILD_BY_LANG.get(language, _generate_child_en)(child, moral, story_length)
 
 
 # Backward compatibility function
@@ -479,27 +609,23 @@ def get_story_prompt(child, moral, language: Language, story_length: int = 5) ->
     Returns:
         A prompt string in the specified language
     """
-    # Convert to proper Child dataclass if needed
-    if not isinstance(child, Child):
-        child_obj = Child(
-            name=child.name,
-            age_category=child.age_category,
-            gender=child.gender,
-            interests=child.interests
-        )
-    else:
-        child_obj = child
-    
-    generator = PromptFactory.get_generator(language)
-    return generator.generate_child_prompt(child_obj, moral, story_length)
+    # Duck-typed profiles (e.g. domain entities with age_category) are
+    # converted; Child instances are used as-is
+    child_obj = child if isinstance(child, Child) else Child(
+        name=child.name,
+        age=getattr(child, "age", getattr(child, "age_category", 0)),
+        gender=child.gender,
+        interests=child.interests
+    )
+    return _CHILD_BY_LANG.get(language, _generate_child_en)(child_obj, moral, story_length)
 
 
 # Predefined heroes
 class Heroes:
     """Collection of predefined heroes for story generation."""
     
-    # English heroes
-    ENGLISH_HEROES = [
+    # English heroes (tuples: shared read-only with callers)
+    ENGLISH_HEROES = (
         Hero(
             name="Captain Wonder",
             age=12,
@@ -520,10 +646,10 @@ class Heroes:
             interests=["stargazing", "music", "ancient history"],
             language=Language.ENGLISH
         )
-    ]
+    )
     
     # Russian heroes
-    RUSSIAN_HEROES = [
+    RUSSIAN_HEROES = (
         Hero(
             name="Капитан Чудо",
             age=10,
@@ -544,19 +670,19 @@ class Heroes:
             interests=["зимние пейзажи", "магия", "древние руны"],
             language=Language.RUSSIAN
         )
-    ]
+    )
     
     @classmethod
     def get_random_english_hero(cls) -> Hero:
         """Get a random English-speaking hero."""
-        import random
-        return random.choice(cls.ENGLISH_HEROES)
+        heroes = cls.ENGLISH_HEROES
+        return heroes[random.randrange(len(heroes))]
     
     @classmethod
     def get_random_russian_hero(cls) -> Hero:
         """Get a random Russian-speaking hero."""
-        import random
-        return random.choice(cls.RUSSIAN_HEROES)
+        heroes = cls.RUSSIAN_HEROES
+        return heroes[random.randrange(len(heroes))]
     
     @classmethod
     def get_english_hero_by_index(cls, index: int) -> Hero:
@@ -569,14 +695,14 @@ class Heroes:
         return cls.RUSSIAN_HEROES[index % len(cls.RUSSIAN_HEROES)]
     
     @classmethod
-    def get_all_english_heroes(cls) -> list[Hero]:
-        """Get all English-speaking heroes."""
-        return cls.ENGLISH_HEROES.copy()
+    def get_all_english_heroes(cls) -> Tuple[Hero, ...]:
+        """Get all English-speaking heroes (the shared, immutable collection)."""
+        return cls.ENGLISH_HEROES
     
     @classmethod
-    def get_all_russian_heroes(cls) -> list[Hero]:
-        """Get all Russian-speaking heroes."""
-        return cls.RUSSIAN_HEROES.copy()
+    def get_all_russian_heroes(cls) -> Tuple[Hero, ...]:
+        """Get all Russian-speaking heroes (the shared, immutable collection)."""
+        return cls.RUSSIAN_HEROES
 
 
 # Predefined children for examples
@@ -4,56 +4,62 @@
 import os
 import sys
 import asyncio
-from pathlib import Path
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from supabase.client import ClientOptions
 
-# Add the src directory to the path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.models import HeroDB, Language
-from src.prompts import Heroes
+def read_migration_file(path: str) -> str:
+    """
+    Read a SQL migration file.
+    
+    Args:
+        path: Path to the SQL file
+        
+    Returns:
+        SQL content of the file
+    """
+    with open(path, 'r') as file:
+        return file.read()
 
 
-def run_sql_migration(client: Client, sql_file_path: str) -> bool:
+def run_sql_migration(client: Client, sql_file_path: str, sql_content: str) -> bool:
     """
     Run a SQL migration file.
     
+    The whole file is submitted in one round-trip through an exec_sql RPC,
+    which only works if the database defines that function for this client's
+    schema (no migration in this repo creates it). Otherwise the migration
+    has to be run in the Supabase SQL editor.
+    
     Args:
         client: The Supabase client
-        sql_file_path: Path to the SQL file to execute
+        sql_file_path: Path to the SQL file (used in messages)
+        sql_content: SQL content of the migration file
         
     Returns:
-        True if successful, False otherwise
+        True if the migration was executed, False if it has to be run manually
     """
     try:
-        with open(sql_file_path, 'r') as file:
-            sql_content = file.read()
-        
-        # Split the SQL content into individual statements
-        statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-        
-        # Execute each statement
-        for statement in statements:
-            print(f"Executing statement: {statement[:50]}..." if len(statement) > 50 else f"Executing statement: {statement}")
-            # Note: Direct SQL execution is not supported in the Supabase Python client
-            # This would need to be done through the Supabase SQL editor or another method
-            print("  -> Statement would be executed in Supabase SQL editor")
-        
-        print(f"Successfully executed migration: {sql_file_path}")
-        return True
+        client.rpc('exec_sql', {'sql': sql_content}).execute()
     except Exception as e:
-        print(f"Error running migration {sql_file_path}: {e}")
+        # Direct SQL execution is not supported in the Supabase Python client
+        # without the exec_sql function
+        print(f"  -> Could not execute via exec_sql RPC ({e})")
+        print("  -> Run this migration in Supabase SQL editor")
         return False
+    
+    print(f"Successfully executed migration: {sql_file_path}")
+    return True
 
 
-def create_heroes_table(client: Client) -> bool:
+def create_heroes_table(client: Client, sql_content: str) -> bool:
     """
     Create the heroes table using the Supabase client.
     
     Args:
         client: The Supabase client
+        sql_content: SQL content of 001_create_heroes_table.sql
         
     Returns:
         True if successful, False otherwise
@@ -61,12 +67,10 @@ def create_heroes_table(client: Client) -> bool:
     try:
         print("Creating heroes table...")
         
-        # Read and display the SQL migration file
-        migration_file = os.path.join(os.path.dirname(__file__), 'migrations', '001_create_heroes_table.sql')
+        # Display the SQL migration file
         print("Run the following SQL in your Supabase SQL editor:")
         print("=" * 50)
-        with open(migration_file, 'r') as file:
-            print(file.read())
+        print(sql_content)
         print("=" * 50)
         
         return True
@@ -75,12 +79,13 @@ def create_heroes_table(client: Client) -> bool:
         return False
 
 
-def populate_heroes_table(client: Client) -> bool:
+def populate_heroes_table(client: Client, sql_content: str) -> bool:
     """
     Populate the heroes table with predefined heroes.
     
     Args:
         client: The Supabase client
+        sql_content: SQL content of 002_populate_heroes_table.sql
         
     Returns:
         True if successful, False otherwise
@@ -88,12 +93,10 @@ def populate_heroes_table(client: Client) -> bool:
     try:
         print("Populating heroes table with predefined heroes...")
         
-        # Read and display the SQL migration file
-        migration_file = os.path.join(os.path.dirname(__file__), 'migrations', '002_populate_heroes_table.sql')
+        # Display the SQL migration file
         print("Run the following SQL in your Supabase SQL editor:")
         print("=" * 50)
-        with open(migration_file, 'r') as file:
-            print(file.read())
+        print(sql_content)
         print("=" * 50)
         
         return True
@@ -140,23 +143,34 @@ async def main():
             if f.endswith('.sql')
         ])
         
+        # Read each migration once, concurrently; the handlers below work on the contents
+        contents = await asyncio.gather(*(
+            asyncio.to_thread(read_migration_file, os.path.join(migrations_dir, migration_file))
+            for migration_file in migration_files
+        ))
+        migration_contents = dict(zip(migration_files, contents))
+        
         print("Migration files to run manually in Supabase:")
         for i, migration_file in enumerate(migration_files, 1):
             print(f"  {i}. {migration_file}")
         
         print("\n" + "=" * 60)
         
+        # Migrations that could not be executed from here
+        manual_migrations = []
+        
         # Execute each migration
         for i, migration_file in enumerate(migration_files, 1):
             print(f"{i}. Executing migration: {migration_file}...")
             migration_path = os.path.join(migrations_dir, migration_file)
+            sql_content = migration_contents[migration_file]
             
             if migration_file == '001_create_heroes_table.sql':
-                if not create_heroes_table(client):
+                if not create_heroes_table(client, sql_content):
                     print(f"Failed to execute migration: {migration_file}")
                     return False
             elif migration_file == '002_populate_heroes_table.sql':
-                if not populate_heroes_table(client):
+                if not populate_heroes_table(client, sql_content):
                     print(f"Failed to execute migration: {migration_file}")
                     return False
             elif migration_file == '003_add_new_hero_example.sql':
@@ -165,13 +179,18 @@ async def main():
                 print("  -> To add a new hero, copy and modify this file, then run it in Supabase SQL editor")
             else:
                 # For any other SQL files
-                if not run_sql_migration(client, migration_path):
-                    print(f"Failed to execute migration: {migration_file}")
-                    return False
+                if not run_sql_migration(client, migration_path, sql_content):
+                    manual_migrations.append(migration_file)
+                    print(f"- Run manually: {migration_file}\n")
+                    continue
             
             print(f"✓ Completed migration: {migration_file}\n")
         
         print("=" * 60)
+        if manual_migrations:
+            print("Migrations to run in the Supabase SQL editor:")
+            for migration_file in manual_migrations:
+                print(f"  - {migration_file}")
         print("Migration instructions:")
         print("1. Copy the SQL from each migration file")
         print("2. Run them in your Supabase SQL editor in order")
@@ -1,22 +1,86 @@
 #!/usr/bin/env python3
-"""Script to create the heroes table in Supabase."""
+"""Script to create the heroes table in Supabase.
+
+Run from the project root as a module:
+    python -m src.setup_heroes_table
+"""
 
 import os
 import sys
+from functools import lru_cache
+from itertools import chain
+from typing import List, NamedTuple, Optional
+import httpx
+from pydantic import TypeAdapter
 from dotenv import load_dotenv
 from supabase import create_client, Client
 from supabase.client import ClientOptions
 
-# Add the src directory to the path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+try:
+    import psycopg
+    PSYCOPG_AVAILABLE = True
+except ImportError:
+    PSYCOPG_AVAILABLE = False
+    psycopg = None
 
 from src.models import HeroDB
-from src.prompts import Heroes
+from src.prompts_old import Heroes
+
+# Idempotent DDL for the heroes table (CREATE ... IF NOT EXISTS), run in order
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+HEROES_DDL_PATHS = (
+    os.path.join(MIGRATIONS_DIR, "001_create_heroes_table.sql"),
+    os.path.join(MIGRATIONS_DIR, "004_add_heroes_unique_index.sql"),
+)
+
+# Last object created by the DDL; if it exists, the whole schema does
+HEROES_SEED_INDEX = "tales.heroes_predefined_name_language_uq"
+
+# Set once the heroes schema is known to exist, so later calls skip the DDL
+_schema_ready = False
+
+# Predefined heroes, shared by every call
+ENGLISH_HEROES = Heroes.get_all_english_heroes()
+RUSSIAN_HEROES = Heroes.get_all_russian_heroes()
+
+# Columns written when seeding; id and timestamps use the table defaults
+HERO_COLUMNS = (
+    "name",
+    "gender",
+    "appearance",
+    "personality_traits",
+    "interests",
+    "strengths",
+    "language",
+)
 
+# Validates and serializes a whole batch of hero rows in one call each
+HERO_ROWS_ADAPTER = TypeAdapter(List[HeroDB])
 
-def create_heroes_table():
-    """Create the heroes table in Supabase and populate it with predefined heroes."""
-    # Load environment variables
+# Unique key of a predefined hero and the predicate of its partial index
+# (see 004_add_heroes_unique_index.sql)
+HERO_CONFLICT_COLUMNS = ("name", "language")
+HERO_CONFLICT_PREDICATE = "user_id IS NULL"
+
+
+class SetupConfig(NamedTuple):
+    """Connection settings for the heroes setup."""
+    supabase_url: str
+    supabase_key: str
+    # Optional direct PostgreSQL connection, used for COPY when psycopg is installed
+    database_url: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def load_config() -> SetupConfig:
+    """Load connection settings from the environment (.env is parsed once).
+    
+    Returns:
+        Setup configuration
+        
+    Raises:
+        ValueError: If the Supabase credentials are missing
+    """
     load_dotenv()
     
     supabase_url = os.getenv("SUPABASE_URL")
@@ -28,87 +92,261 @@ def create_heroes_table():
             "Set SUPABASE_URL and SUPABASE_KEY environment variables."
         )
     
-    # Create client with schema specification
-    client: Client = create_client(
-        supabase_url=supabase_url,
-        supabase_key=supabase_key,
+    return SetupConfig(supabase_url, supabase_key, os.getenv("DATABASE_URL"))
+
+
+@lru_cache(maxsize=1)
+def get_client() -> Client:
+    """Get the shared Supabase client for the tales schema.
+    
+    The client is created once and wraps a keep-alive HTTP connection pool,
+    so repeated requests reuse the open TLS connection.
+    
+    Returns:
+        Supabase client
+    """
+    config = load_config()
+    return create_client(
+        supabase_url=config.supabase_url,
+        supabase_key=config.supabase_key,
         options=ClientOptions(
             postgrest_client_timeout=10,
             storage_client_timeout=10,
             schema="tales",
+            httpx_client=httpx.Client(
+                timeout=10,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+                follow_redirects=True
+            ),
+        )
+    )
+
+
+def format_hero_list(title: str, heroes) -> str:
+    """Format a numbered listing of heroes for display.
+    
+    Args:
+        title: Listing heading
+        heroes: Predefined Hero objects
+        
+    Returns:
+        The listing text, one line per field, ending with a newline
+    """
+    lines = [f"\n{title} ({len(heroes)}):"]
+    for i, hero in enumerate(heroes, 1):
+        lines.append(
+            f"{i}. {hero.name}\n"
+            f"   Gender: {hero.gender}\n"
+            f"   Appearance: {hero.appearance}\n"
+            f"   Personality traits: {hero.joined_traits}\n"
+            f"   Interests: {hero.joined_interests}\n"
+            f"   Strengths: {hero.joined_strengths}"
         )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def build_hero_rows(heroes):
+    """Convert predefined heroes to rows for the heroes table.
+    
+    Args:
+        heroes: Predefined Hero objects
+        
+    Returns:
+        List of JSON-ready row dicts (id and timestamps are left to the database)
+    """
+    hero_rows = HERO_ROWS_ADAPTER.validate_python([
+        {
+            "name": hero.name,
+            "gender": hero.gender,
+            "appearance": hero.appearance,
+            "personality_traits": hero.personality_traits,
+            "interests": hero.interests,
+            "strengths": hero.strengths,
+            "language": hero.language,
+        }
+        for hero in heroes
+    ])
+    return HERO_ROWS_ADAPTER.dump_python(hero_rows, mode="json", exclude_none=True)
+
+
+def insert_heroes(client: Client, rows):
+    """Insert the predefined heroes that are not in the table yet.
+    
+    PostgREST's on_conflict cannot target the partial unique index on
+    predefined heroes, so the existing ones are looked up first and skipped,
+    and the rest go in one multi-row INSERT.
+    
+    Args:
+        client: Supabase client
+        rows: Row dicts from build_hero_rows
+        
+    Returns:
+        Inserted rows as returned by Supabase
+    """
+    if not rows:
+        return []
+    existing = client.table("heroes").select(",".join(HERO_CONFLICT_COLUMNS)).is_("user_id", "null").execute()
+    seeded = {(hero["name"], hero["language"]) for hero in existing.data or []}
+    new_rows = [row for row in rows if (row["name"], row["language"]) not in seeded]
+    if not new_rows:
+        return []
+    response = client.table("heroes").insert(new_rows).execute()
+    return response.data or []
+
+
+def heroes_schema_exists(database_url: Optional[str]) -> bool:
+    """Check whether the heroes table and its seed index already exist.
+    
+    The check needs the direct PostgreSQL connection; without it the
+    (idempotent) DDL is simply executed.
+    
+    Args:
+        database_url: Optional PostgreSQL connection string
+        
+    Returns:
+        True if the schema exists, False if it is missing or cannot be checked
+    """
+    if not (database_url and PSYCOPG_AVAILABLE):
+        return False
+    try:
+        with psycopg.connect(database_url) as conn:
+            row = conn.execute(
+                "SELECT to_regclass(%s) IS NOT NULL", (HEROES_SEED_INDEX,)
+            ).fetchone()
+        return bool(row and row[0])
+    except Exception as e:
+        print(f"  -> Could not check for the heroes table ({e})")
+        return False
+
+
+def create_table(client: Client, ddl: str, database_url: Optional[str] = None) -> bool:
+    """Execute the heroes table DDL in one server round trip.
+    
+    Uses the direct PostgreSQL connection when available, otherwise the
+    exec_sql RPC (same approach as run_migrations.py).
+    
+    Args:
+        client: Supabase client
+        ddl: Idempotent DDL script
+        database_url: Optional PostgreSQL connection string
+        
+    Returns:
+        True if the DDL was executed, False if it has to be run manually
+    """
+    try:
+        if database_url and PSYCOPG_AVAILABLE:
+            with psycopg.connect(database_url) as conn:
+                conn.execute(ddl)
+        else:
+            client.rpc('exec_sql', {'sql': ddl}).execute()
+        return True
+    except Exception as e:
+        print(f"  -> Could not execute the table DDL ({e})")
+        print(f"  -> Run {', '.join(HEROES_DDL_PATHS)} in the Supabase SQL editor")
+        return False
+
+
+def copy_heroes(database_url: str, rows):
+    """Bulk-load hero rows with PostgreSQL COPY over a direct connection.
+    
+    COPY cannot resolve conflicts, so the rows are copied into a temporary
+    table and merged into tales.heroes with one INSERT ... ON CONFLICT,
+    which keeps re-runs from duplicating heroes.
+    
+    Args:
+        database_url: PostgreSQL connection string
+        rows: Row dicts from build_hero_rows
+        
+    Returns:
+        Number of rows copied
+    """
+    if not PSYCOPG_AVAILABLE:
+        raise ImportError("psycopg library is not installed")
+    
+    columns = ", ".join(HERO_COLUMNS)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in HERO_COLUMNS
+        if column not in HERO_CONFLICT_COLUMNS
     )
+    with psycopg.connect(database_url) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE heroes_seed "
+                "(LIKE tales.heroes INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            with cursor.copy(f"COPY heroes_seed ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(tuple(row[column] for column in HERO_COLUMNS))
+            cursor.execute(
+                f"INSERT INTO tales.heroes ({columns}) "
+                f"SELECT {columns} FROM heroes_seed "
+                f"ON CONFLICT ({', '.join(HERO_CONFLICT_COLUMNS)}) WHERE {HERO_CONFLICT_PREDICATE} "
+                f"DO UPDATE SET {updates}, updated_at = NOW()"
+            )
+    return len(rows)
+
+
+def create_heroes_table() -> bool:
+    """Create the heroes table in Supabase and populate it with predefined heroes.
+    
+    Returns:
+        True if the table is ready and seeded, False otherwise
+    """
+    global _schema_ready
+    
+    config = load_config()
+    client = get_client()
     
     print("Creating heroes table...")
     
-    # Note: In a real Supabase environment, you would typically create the table
-    # using SQL migrations or the Supabase dashboard. This script is for demonstration.
-    # The table structure would be:
-    # CREATE TABLE heroes (
-    #     id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
-    #     name TEXT NOT NULL,
-    #     gender TEXT NOT NULL,
-    #     appearance TEXT NOT NULL,
-    #     personality_traits TEXT[] NOT NULL,
-    #     interests TEXT[] NOT NULL,
-    #     strengths TEXT[] NOT NULL,
-    #     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    #     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-    # );
-    
-    print("Heroes table structure:")
-    print("- id (UUID, primary key)")
-    print("- name (TEXT)")
-    print("- gender (TEXT)")
-    print("- appearance (TEXT)")
-    print("- personality_traits (TEXT[])")
-    print("- interests (TEXT[])")
-    print("- strengths (TEXT[])")
-    print("- language (TEXT)")
-    print("- created_at (TIMESTAMP)")
-    print("- updated_at (TIMESTAMP)")
-    
-    print("\nTo create this table in Supabase, run the following SQL:")
-    print("""
-CREATE TABLE heroes (
-    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
-    name TEXT NOT NULL,
-    gender TEXT NOT NULL,
-    appearance TEXT NOT NULL,
-    personality_traits TEXT[] NOT NULL,
-    interests TEXT[] NOT NULL,
-    strengths TEXT[] NOT NULL,
-    language TEXT NOT NULL DEFAULT 'en',
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-);
-    """)
+    if not _schema_ready and heroes_schema_exists(config.database_url):
+        print("Heroes table already exists")
+        _schema_ready = True
+    
+    if not _schema_ready:
+        ddl_parts = []
+        for ddl_path in HEROES_DDL_PATHS:
+            with open(ddl_path, "r", encoding="utf-8") as f:
+                ddl_parts.append(f.read())
+        ddl = "\n".join(ddl_parts)
+        if create_table(client, ddl, config.database_url):
+            print("Heroes table is ready")
+            _schema_ready = True
     
     # Show how to populate with predefined heroes
     print("\nPredefined heroes that can be added to the table:")
     
-    # English heroes
-    english_heroes = Heroes.get_all_english_heroes()
-    print(f"\nEnglish heroes ({len(english_heroes)}):")
-    for i, hero in enumerate(english_heroes):
-        print(f"{i+1}. {hero.name}")
-        print(f"   Gender: {hero.gender}")
-        print(f"   Appearance: {hero.appearance}")
-        print(f"   Personality traits: {', '.join(hero.personality_traits)}")
-        print(f"   Interests: {', '.join(hero.interests)}")
-        print(f"   Strengths: {', '.join(hero.strengths)}")
-    
-    # Russian heroes
-    russian_heroes = Heroes.get_all_russian_heroes()
-    print(f"\nRussian heroes ({len(russian_heroes)}):")
-    for i, hero in enumerate(russian_heroes):
-        print(f"{i+1}. {hero.name}")
-        print(f"   Gender: {hero.gender}")
-        print(f"   Appearance: {hero.appearance}")
-        print(f"   Personality traits: {', '.join(hero.personality_traits)}")
-        print(f"   Interests: {', '.join(hero.interests)}")
-        print(f"   Strengths: {', '.join(hero.strengths)}")
+    english_heroes = ENGLISH_HEROES
+    russian_heroes = RUSSIAN_HEROES
+    # Write both listings at once instead of one print per line
+    sys.stdout.write(
+        format_hero_list("English heroes", english_heroes)
+        + format_hero_list("Russian heroes", russian_heroes)
+    )
+    
+    if not _schema_ready:
+        # Seeding needs the table and its unique index
+        print("\nSkipping hero seeding until the heroes table DDL has been applied")
+        return False
+    
+    # Populate the table with all predefined heroes: COPY over a direct
+    # connection when available, otherwise one PostgREST request
+    rows = build_hero_rows(chain(english_heroes, russian_heroes))
+    print(f"\nInserting {len(rows)} predefined heroes...")
+    try:
+        if config.database_url and PSYCOPG_AVAILABLE:
+            copied = copy_heroes(config.database_url, rows)
+            print(f"Copied {copied} heroes")
+        else:
+            inserted = insert_heroes(client, rows)
+            print(f"Inserted {len(inserted)} heroes")
+    except Exception as e:
+        print(f"Error inserting heroes: {e}")
+        return False
+    return True
 
 
 if __name__ == "__main__":
-    create_heroes_table()
\ No newline at end of file
+    sys.exit(0 if create_heroes_table() else 1)
\ No newline at end of file
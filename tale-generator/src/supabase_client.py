@@ -2,12 +2,20 @@
 
 import logging
 import os
-from typing import List, Optional, Any, Dict
+import threading
+import time
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+import httpx
 from supabase import create_client, Client
 from supabase.client import ClientOptions
+from postgrest import ReturnMethod
+from pydantic import TypeAdapter, ValidationError
 from src.models import StoryDB, ChildDB, HeroDB, DailyFreeStoryDB
 from src.infrastructure.persistence.models import GenerationDB, FreeStoryDB, DailyFreeStoryDB as PersistenceDailyFreeStoryDB, DailyStoryReactionDB
 from src.domain.services.subscription_service import UserSubscription, SubscriptionPlan, SubscriptionStatus
+from src.core.exceptions import DatabaseError
 from dotenv import load_dotenv
 from typing import Optional
 from datetime import datetime
@@ -15,15 +23,222 @@ from datetime import datetime
 # Set up logger
 logger = logging.getLogger("tale_generator.supabase")
 
-# Load environment variables
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from .env once, when the credentials are not already set."""
+    if not (os.getenv("SUPABASE_URL") and os.getenv("SUPABASE_KEY")):
+        load_dotenv()
+
+
+# Connection pool shared by the PostgREST and storage clients. The transport
+# retries once on connection errors, e.g. after the server dropped an idle
+# keep-alive connection.
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+_HTTP_TIMEOUT = 10.0
+_HTTP_CONNECT_RETRIES = 1
+
+# Table columns, which use the same names as the model fields
+_CHILD_KEYS: Tuple[str, ...] = (
+    'name', 'age_category', 'gender', 'interests', 'user_id', 'created_at', 'updated_at', 'id',
+)
+_HERO_KEYS: Tuple[str, ...] = (
+    'name', 'gender', 'appearance', 'personality_traits', 'interests', 'strengths', 'language',
+    'created_at', 'updated_at', 'id', 'user_id',
+)
+# Columns written by update_hero (the ID is only used to select the row)
+_HERO_UPDATE_KEYS: Tuple[str, ...] = tuple(key for key in _HERO_KEYS if key != 'id')
+# Columns selected by the story list endpoints and returned by story updates:
+# the stories table columns that back StoryDB fields, leaving out audio
+# metadata and other denormalized extras the models do not read
+_STORY_COLUMNS = ",".join((
+    'id', 'title', 'content', 'summary', 'moral', 'child_id', 'child_name', 'child_gender',
+    'child_interests', 'hero_id', 'language', 'rating', 'audio_file_url', 'user_id', 'status',
+    'created_at', 'updated_at', 'generation_id', 'parent_id', 'story_length', 'theme',
+))
+# Columns written by save_story
+_STORY_WRITE_KEYS: Tuple[str, ...] = (
+    'child_id', 'child_name', 'age_category', 'child_gender', 'child_interests', 'hero_id',
+    'created_at', 'updated_at', 'id', 'title', 'content', 'summary', 'moral', 'language',
+    'rating', 'story_length', 'audio_file_url', 'user_id', 'status', 'generation_id',
+    'parent_id', 'theme',
+)
+
+# Timestamp columns serialized to ISO strings on write
+_DT_KEYS = frozenset({'created_at', 'updated_at'})
+
+# List adapters validating a whole response in one call; unknown columns
+# are ignored by the models
+_CHILDREN_ADAPTER = TypeAdapter(List[ChildDB])
+_HEROES_ADAPTER = TypeAdapter(List[HeroDB])
+_STORIES_ADAPTER = TypeAdapter(List[StoryDB])
+
+# PostgREST filter matching rows owned by the given user or by nobody
+_USER_OR_UNOWNED_FILTER = "user_id.is.null,user_id.eq.{}".format
+
+
+_MISSING = object()
+
+
+def _pick_fields(model: Any, keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Read the given fields off a model instead of dumping the whole model.
+    
+    Keys the model does not have are skipped.
+    """
+    picked = {}
+    for key in keys:
+        value = getattr(model, key, _MISSING)
+        if value is not _MISSING:
+            picked[key] = value
+    return picked
+
+
+def _compile_write_mapper(
+    keys: Tuple[str, ...], enum_keys: FrozenSet[str] = frozenset()
+) -> Callable[[Any], Dict[str, Any]]:
+    """Build the function mapping a model to the row written for it.
+    
+    Which columns hold timestamps or enums is worked out once here, so the
+    mapper only converts the columns that need it.
+    
+    Args:
+        keys: Columns to write
+        enum_keys: Columns holding enums, written as their values
+        
+    Returns:
+        Function taking a model and returning the row dict
+    """
+    timestamp_keys = tuple(key for key in keys if key in _DT_KEYS)
+    value_keys = tuple(key for key in keys if key in enum_keys)
+    
+    def map_for_write(model: Any) -> Dict[str, Any]:
+        row = _pick_fields(model, keys)
+        for key in timestamp_keys:
+            value = row.get(key)
+            if value is not None and not isinstance(value, str):
+                row[key] = value.isoformat()
+        for key in value_keys:
+            value = row.get(key)
+            if hasattr(value, 'value'):
+                row[key] = value.value
+        
+        # Remove ID if it's None (let Supabase generate it)
+        if row.get('id') is None:
+            row.pop('id', None)
+        return row
+    
+    return map_for_write
+
+
+_map_child_for_write = _compile_write_mapper(_CHILD_KEYS)
+_map_hero_for_write = _compile_write_mapper(_HERO_KEYS, frozenset({'language'}))
+_map_hero_for_update = _compile_write_mapper(_HERO_UPDATE_KEYS, frozenset({'language'}))
+_map_story_for_write = _compile_write_mapper(_STORY_WRITE_KEYS)
+
+
+class _TTLCache:
+    """Small thread-safe in-process cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the oldest entry when the cache is full."""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+
+    def pop(self, key: str) -> None:
+        """Drop a cached value, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Short-lived caches for single hero/child reads, keyed by ID. Entries are
+# dropped when this process updates or deletes the row; other processes may
+# see stale rows for up to the TTL. Reads return deep copies, so callers can
+# mutate list fields (interests, strengths, ...) without touching the cache.
+_ENTITY_CACHE_TTL = 15
+_HERO_CACHE = _TTLCache(maxsize=1024, ttl=_ENTITY_CACHE_TTL)
+_CHILD_CACHE = _TTLCache(maxsize=1024, ttl=_ENTITY_CACHE_TTL)
+
+# Subscriptions are read on every story request but change only through the
+# counter and plan methods below, which drop the cached entry
+_SUBSCRIPTION_CACHE = _TTLCache(maxsize=1024, ttl=60)
+
+
+def _validate_rows(adapter: TypeAdapter, model_cls: type, rows: List[Dict[str, Any]]) -> list:
+    """Validate database rows into models with a single pydantic-core call.
+    
+    If any row fails validation, the rows are validated one by one instead
+    and the invalid ones are logged and skipped.
+    
+    Args:
+        adapter: List adapter for the model
+        model_cls: Model class the adapter validates
+        rows: Rows returned by Supabase
+        
+    Returns:
+        List of models for the valid rows
+    """
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError:
+        models = []
+        for row in rows:
+            try:
+                models.append(model_cls.model_validate(row))
+            except ValidationError as e:
+                logger.warning(f"Skipping {model_cls.__name__} row due to validation error: {str(e)}")
+        return models
 
 
 class SupabaseClient:
     """Client for interacting with Supabase database."""
 
+    _instance: Optional["SupabaseClient"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "SupabaseClient":
+        """Get the process-wide client, creating it on first use.
+        
+        Each SupabaseClient holds its own connection pool, so callers should
+        share this instance instead of constructing new clients.
+        
+        Returns:
+            The shared SupabaseClient
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         """Initialize the Supabase client."""
+        _load_env()
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_KEY")
         
@@ -41,8 +256,21 @@ class SupabaseClient:
                 postgrest_client_timeout=10,
                 storage_client_timeout=10,
                 schema="tales",
+                httpx_client=httpx.Client(
+                    timeout=_HTTP_TIMEOUT,
+                    transport=httpx.HTTPTransport(
+                        retries=_HTTP_CONNECT_RETRIES, limits=_HTTP_LIMITS
+                    ),
+                ),
             )
         )
+        
+        # Reuse the storage bucket and table request builders; each call on
+        # them builds a fresh request, so they are safe to share
+        self._tales_bucket = self.client.storage.from_("tales")
+        self._children_tbl = self.client.table("children")
+        self._heroes_tbl = self.client.table("heroes")
+        self._stories_tbl = self.client.table("stories")
     
     def upload_audio_file(self, file_data: bytes, filename: str, story_id: str) -> Optional[str]:
         """
@@ -64,7 +292,7 @@ class SupabaseClient:
             file_path = f"stories/{story_id}/{filename}"
             
             # Upload the file to the 'tales' bucket
-            response = self.client.storage.from_("tales").upload(
+            response = self._tales_bucket.upload(
                 path=file_path,
                 file=file_data,
                 file_options={"content-type": "audio/mpeg"}
@@ -72,7 +300,7 @@ class SupabaseClient:
             
             if response:
                 # Get the public URL for the file
-                public_url = self.client.storage.from_("tales").get_public_url(file_path)
+                public_url = self._tales_bucket.get_public_url(file_path)
                 logger.info(f"Successfully uploaded audio file. Public URL: {public_url}")
                 return public_url
             else:
@@ -96,7 +324,7 @@ class SupabaseClient:
         """
         try:
             file_path = f"stories/{story_id}/{filename}"
-            public_url = self.client.storage.from_("tales").get_public_url(file_path)
+            public_url = self._tales_bucket.get_public_url(file_path)
             return public_url
         except Exception as e:
             logger.error(f"Error getting audio file URL: {str(e)}", exc_info=True)
@@ -112,54 +340,18 @@ class SupabaseClient:
             The saved child with ID and timestamps
         """
         try:
-            # Convert ChildDB to dictionary for Supabase
-            child_dict = child.model_dump()
-            
-            # Map camelCase keys to snake_case keys for Supabase
-            mapped_child_dict = {}
-            key_mapping = {
-                'name': 'name',
-                'age_category': 'age_category',
-                'gender': 'gender',
-                'interests': 'interests',
-                'user_id': 'user_id',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id'
-            }
+            # Pick the columns to write
+            mapped_child_dict = _map_child_for_write(child)
             
-            for py_key, db_key in key_mapping.items():
-                if py_key in child_dict:
-                    value = child_dict[py_key]
-                    # Handle datetime serialization
-                    if value and (py_key == 'created_at' or py_key == 'updated_at'):
-                        if hasattr(value, 'isoformat'):
-                            mapped_child_dict[db_key] = value.isoformat()
-                        else:
-                            mapped_child_dict[db_key] = value
-                    else:
-                        mapped_child_dict[db_key] = value
-            
-            # Remove ID if it's None (let Supabase generate it)
-            if mapped_child_dict.get('id') is None:
-                mapped_child_dict.pop('id', None)
-            
-            response = self.client.table("children").insert(mapped_child_dict).execute()
+            response = self._children_tbl.insert(mapped_child_dict).execute()
             
             if response.data:
                 # Return the saved child with generated ID and timestamps
-                saved_child_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                model_child_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in saved_child_data:
-                        model_child_data[py_key] = saved_child_data[db_key]
-                
-                return ChildDB(**model_child_data)
+                return ChildDB.model_validate(response.data[0])
             else:
                 raise Exception("Failed to save child")
         except Exception as e:
-            raise Exception(f"Error saving child: {str(e)}")
+            raise DatabaseError(f"Error saving child: {str(e)}", operation="save_child") from e
 
     def get_child(self, child_id: str, user_id: Optional[str] = None) -> Optional[ChildDB]:
         """Retrieve a child by ID.
@@ -172,34 +364,20 @@ class SupabaseClient:
             The child if found, None otherwise
         """
         try:
-            query = self.client.table("children").select("*").eq("id", child_id)
-            if user_id:
-                query = query.eq("user_id", user_id)
-            response = query.execute()
+            child = _CHILD_CACHE.get(child_id)
+            if child is None:
+                response = self._children_tbl.select("*").eq("id", child_id).maybe_single().execute()
+                if response is None:
+                    return None
+                child = ChildDB.model_validate(response.data)
+                _CHILD_CACHE.set(child_id, child)
             
-            if response.data:
-                child_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                key_mapping = {
-                    'name': 'name',
-                    'age_category': 'age_category',
-                    'gender': 'gender',
-                    'interests': 'interests',
-                    'user_id': 'user_id',
-                    'created_at': 'created_at',
-                    'updated_at': 'updated_at',
-                    'id': 'id'
-                }
-                
-                model_child_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in child_data:
-                        model_child_data[py_key] = child_data[db_key]
-                
-                return ChildDB(**model_child_data)
-            return None
+            # Check ownership on the cached row
+            if user_id and child.user_id != user_id:
+                return None
+            return child.model_copy(deep=True)
         except Exception as e:
-            raise Exception(f"Error retrieving child: {str(e)}")
+            raise DatabaseError(f"Error retrieving child: {str(e)}", operation="get_child") from e
 
     def get_all_children(self, user_id: Optional[str] = None) -> List[ChildDB]:
         """Retrieve all children.
@@ -211,36 +389,14 @@ class SupabaseClient:
             List of all children (filtered by user_id if provided)
         """
         try:
-            query = self.client.table("children").select("*")
+            query = self._children_tbl.select("*")
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
             
-            children = []
-            key_mapping = {
-                'name': 'name',
-                'age_category': 'age_category',
-                'gender': 'gender',
-                'interests': 'interests',
-                'user_id': 'user_id',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id'
-            }
-            
-            for child_data in response.data:
-                model_child_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in child_data:
-                        model_child_data[py_key] = child_data[db_key]
-                
-                # Only append if we have the required fields
-                if all(key in model_child_data for key in ['name', 'age_category', 'gender']):
-                    children.append(ChildDB(**model_child_data))
-            
-            return children
+            return _validate_rows(_CHILDREN_ADAPTER, ChildDB, response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving children: {str(e)}")
+            raise DatabaseError(f"Error retrieving children: {str(e)}", operation="get_all_children") from e
 
     def save_hero(self, hero: HeroDB) -> HeroDB:
         """Save a hero to the database.
@@ -252,60 +408,18 @@ class SupabaseClient:
             The saved hero with ID and timestamps
         """
         try:
-            # Convert HeroDB to dictionary for Supabase
-            hero_dict = hero.model_dump()
-            
-            # Map camelCase keys to snake_case keys for Supabase
-            mapped_hero_dict = {}
-            key_mapping = {
-                'name': 'name',
-                'gender': 'gender',
-                'appearance': 'appearance',
-                'personality_traits': 'personality_traits',
-                'interests': 'interests',
-                'strengths': 'strengths',
-                'language': 'language',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'user_id': 'user_id'  # Add user_id field
-            }
-            
-            for py_key, db_key in key_mapping.items():
-                if py_key in hero_dict:
-                    value = hero_dict[py_key]
-                    # Handle datetime serialization
-                    if value and py_key in ('created_at', 'updated_at'):
-                        if hasattr(value, 'isoformat'):
-                            mapped_hero_dict[db_key] = value.isoformat()
-                        else:
-                            mapped_hero_dict[db_key] = value
-                    # Handle Language enum serialization
-                    elif py_key == 'language':
-                        mapped_hero_dict[db_key] = value.value if hasattr(value, 'value') else value
-                    else:
-                        mapped_hero_dict[db_key] = value
-            
-            # Remove ID if it's None (let Supabase generate it)
-            if mapped_hero_dict.get('id') is None:
-                mapped_hero_dict.pop('id', None)
+            # Pick the columns to write
+            mapped_hero_dict = _map_hero_for_write(hero)
             
-            response = self.client.table("heroes").insert(mapped_hero_dict).execute()
+            response = self._heroes_tbl.insert(mapped_hero_dict).execute()
             
             if response.data:
                 # Return the saved hero with generated ID and timestamps
-                saved_hero_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                model_hero_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in saved_hero_data:
-                        model_hero_data[py_key] = saved_hero_data[db_key]
-                
-                return HeroDB(**model_hero_data)
+                return HeroDB.model_validate(response.data[0])
             else:
                 raise Exception("Failed to save hero")
         except Exception as e:
-            raise Exception(f"Error saving hero: {str(e)}")
+            raise DatabaseError(f"Error saving hero: {str(e)}", operation="save_hero") from e
 
     def get_hero(self, hero_id: str) -> Optional[HeroDB]:
         """Retrieve a hero by ID.
@@ -317,33 +431,17 @@ class SupabaseClient:
             The hero if found, None otherwise
         """
         try:
-            response = self.client.table("heroes").select("*").eq("id", hero_id).execute()
+            hero = _HERO_CACHE.get(hero_id)
+            if hero is None:
+                response = self._heroes_tbl.select("*").eq("id", hero_id).maybe_single().execute()
+                if response is None:
+                    return None
+                hero = HeroDB.model_validate(response.data)
+                _HERO_CACHE.set(hero_id, hero)
             
-            if response.data:
-                hero_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                key_mapping = {
-                    'name': 'name',
-                    'gender': 'gender',
-                    'appearance': 'appearance',
-                    'personality_traits': 'personality_traits',
-                    'interests': 'interests',
-                    'strengths': 'strengths',
-                    'language': 'language',
-                    'created_at': 'created_at',
-                    'updated_at': 'updated_at',
-                    'id': 'id'
-                }
-                
-                model_hero_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in hero_data:
-                        model_hero_data[py_key] = hero_data[db_key]
-                
-                return HeroDB(**model_hero_data)
-            return None
+            return hero.model_copy(deep=True)
         except Exception as e:
-            raise Exception(f"Error retrieving hero: {str(e)}")
+            raise DatabaseError(f"Error retrieving hero: {str(e)}", operation="get_hero") from e
 
     def get_all_heroes(self, user_id: Optional[str] = None) -> List[HeroDB]:
         """Retrieve all heroes.
@@ -355,40 +453,15 @@ class SupabaseClient:
             List of all heroes (filtered by user_id if provided)
         """
         try:
-            query = self.client.table("heroes").select("*")
+            query = self._heroes_tbl.select("*")
             if user_id:
                 # Filter for heroes owned by user or unowned heroes
-                query = query.or_(f"user_id.is.null,user_id.eq.{user_id}")
+                query = query.or_(_USER_OR_UNOWNED_FILTER(user_id))
             response = query.execute()
             
-            heroes = []
-            key_mapping = {
-                'name': 'name',
-                'gender': 'gender',
-                'appearance': 'appearance',
-                'personality_traits': 'personality_traits',
-                'interests': 'interests',
-                'strengths': 'strengths',
-                'language': 'language',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'user_id': 'user_id'  # Add user_id field
-            }
-            
-            for hero_data in response.data:
-                model_hero_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in hero_data:
-                        model_hero_data[py_key] = hero_data[db_key]
-                
-                # Only append if we have the required fields
-                if all(key in model_hero_data for key in ['name', 'gender', 'appearance']):
-                    heroes.append(HeroDB(**model_hero_data))
-            
-            return heroes
+            return _validate_rows(_HEROES_ADAPTER, HeroDB, response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving heroes: {str(e)}")
+            raise DatabaseError(f"Error retrieving heroes: {str(e)}", operation="get_all_heroes") from e
 
     def update_hero(self, hero: HeroDB, user_id: Optional[str] = None) -> HeroDB:
         """Update a hero in the database.
@@ -404,79 +477,30 @@ class SupabaseClient:
             if not hero.id:
                 raise ValueError("Hero ID is required for update")
             
-            # If user_id is provided, verify ownership
+            # Set the user_id on the hero to ensure it's correctly associated
             if user_id:
-                # First check if the hero exists and belongs to the user
-                existing_hero = self.get_hero(hero.id)
-                if not existing_hero:
-                    raise Exception("Hero not found")
-                
-                # Check if the hero is owned by the user or is unowned
-                if existing_hero.user_id and existing_hero.user_id != user_id:
-                    raise Exception("You do not have permission to update this hero")
-                
-                # Set the user_id on the hero to ensure it's correctly associated
                 hero.user_id = user_id
             
-            # Convert HeroDB to dictionary for Supabase
-            hero_dict = hero.model_dump()
-            
-            # Map camelCase keys to snake_case keys for Supabase
-            mapped_hero_dict = {}
-            key_mapping = {
-                'name': 'name',
-                'gender': 'gender',
-                'appearance': 'appearance',
-                'personality_traits': 'personality_traits',
-                'interests': 'interests',
-                'strengths': 'strengths',
-                'language': 'language',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'user_id': 'user_id'  # Add user_id field
-            }
-            
-            for py_key, db_key in key_mapping.items():
-                if py_key in hero_dict:
-                    value = hero_dict[py_key]
-                    # Handle datetime serialization
-                    if value and (py_key == 'created_at' or py_key == 'updated_at'):
-                        if hasattr(value, 'isoformat'):
-                            mapped_hero_dict[db_key] = value.isoformat()
-                        else:
-                            mapped_hero_dict[db_key] = value
-                    # Handle Language enum serialization
-                    elif py_key == 'language':
-                        mapped_hero_dict[db_key] = value.value if hasattr(value, 'value') else value
-                    else:
-                        mapped_hero_dict[db_key] = value
+            # Pick the columns to write
+            mapped_hero_dict = _map_hero_for_update(hero)
             
             # Build the update query
-            query = self.client.table("heroes").update(mapped_hero_dict).eq("id", hero.id)
+            query = self._heroes_tbl.update(mapped_hero_dict).eq("id", hero.id)
             
-            # If user_id is provided, also filter by user_id to ensure ownership
+            # If user_id is provided, only match heroes owned by the user or unowned
             if user_id:
-                query = query.eq("user_id", user_id)
+                query = query.or_(_USER_OR_UNOWNED_FILTER(user_id))
             
             response = query.execute()
             
             if response.data:
-                # Return the updated hero
-                updated_hero_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                model_hero_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in updated_hero_data:
-                        model_hero_data[py_key] = updated_hero_data[db_key]
-                
-                # Add the ID back
-                model_hero_data['id'] = hero.id
-                
-                return HeroDB(**model_hero_data)
+                _HERO_CACHE.pop(hero.id)
+                # Return the updated hero, keeping the ID it was updated by
+                return HeroDB.model_validate({**response.data[0], 'id': hero.id})
             else:
-                raise Exception("Failed to update hero - you may not have permission to edit this hero")
+                raise Exception("Hero not found or you do not have permission to update it")
         except Exception as e:
-            raise Exception(f"Error updating hero: {str(e)}")
+            raise DatabaseError(f"Error updating hero: {str(e)}", operation="update_hero") from e
 
     def delete_hero(self, hero_id: str, user_id: Optional[str] = None) -> bool:
         """Delete a hero by ID.
@@ -486,31 +510,22 @@ class SupabaseClient:
             user_id: Optional user ID to verify ownership
             
         Returns:
-            True if deleted, False otherwise
+            True if deleted, False if the hero was not found or not permitted
         """
         try:
-            # If user_id is provided, verify ownership before deleting
-            if user_id:
-                # First check if the hero exists and belongs to the user
-                existing_hero = self.get_hero(hero_id)
-                if not existing_hero:
-                    return False
-                
-                # Check if the hero is owned by the user
-                if existing_hero.user_id and existing_hero.user_id != user_id:
-                    raise Exception("You do not have permission to delete this hero")
-            
             # Build the delete query
-            query = self.client.table("heroes").delete().eq("id", hero_id)
+            query = self._heroes_tbl.delete().eq("id", hero_id)
             
-            # If user_id is provided, also filter by user_id to ensure ownership
+            # If user_id is provided, only match heroes owned by the user or unowned
             if user_id:
-                query = query.eq("user_id", user_id)
+                query = query.or_(_USER_OR_UNOWNED_FILTER(user_id))
             
             response = query.execute()
+            if response.data:
+                _HERO_CACHE.pop(hero_id)
             return len(response.data) > 0
         except Exception as e:
-            raise Exception(f"Error deleting hero: {str(e)}")
+            raise DatabaseError(f"Error deleting hero: {str(e)}", operation="delete_hero") from e
 
     def save_story(self, story: StoryDB) -> StoryDB:
         """Save a story to the database.
@@ -522,68 +537,49 @@ class SupabaseClient:
             The saved story with ID and timestamps
         """
         try:
-            # Convert StoryDB to dictionary for Supabase
-            story_dict = story.model_dump()
-            
-            # Map camelCase keys to snake_case keys for Supabase
-            mapped_story_dict = {}
-            key_mapping = {
-                'child_id': 'child_id',
-                'child_name': 'child_name',
-                'age_category': 'age_category',
-                'child_gender': 'child_gender',
-                'child_interests': 'child_interests',
-                'hero_id': 'hero_id',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'title': 'title',
-                'content': 'content',
-                'summary': 'summary',
-                'moral': 'moral',
-                'language': 'language',
-                'rating': 'rating',
-                'story_length': 'story_length',
-                'audio_file_url': 'audio_file_url',
-                'user_id': 'user_id',
-                'status': 'status',
-                'generation_id': 'generation_id',
-                'parent_id': 'parent_id',
-                'theme': 'theme',
-            }
-            
-            for py_key, db_key in key_mapping.items():
-                if py_key in story_dict:
-                    value = story_dict[py_key]
-                    # Handle datetime serialization
-                    if value and py_key in ('created_at', 'updated_at'):
-                        if hasattr(value, 'isoformat'):
-                            mapped_story_dict[db_key] = value.isoformat()
-                        else:
-                            mapped_story_dict[db_key] = value
-                    else:
-                        mapped_story_dict[db_key] = value
-            
-            # Remove ID if it's None (let Supabase generate it)
-            if mapped_story_dict.get('id') is None:
-                mapped_story_dict.pop('id', None)
-            
-            response = self.client.table("stories").insert(mapped_story_dict).execute()
+            response = self._stories_tbl.insert(_map_story_for_write(story)).execute()
             
             if response.data:
                 # Return the saved story with generated ID and timestamps
-                saved_story_data = response.data[0]
-                # Map DB column names back to model keys (py_key -> db_key in key_mapping)
-                model_story_data = {}
-                for py_key, db_key in key_mapping.items():
-                    if db_key in saved_story_data:
-                        model_story_data[py_key] = saved_story_data[db_key]
-                
-                return StoryDB(**model_story_data)
+                return StoryDB.model_validate(response.data[0])
             else:
                 raise Exception("Failed to save story")
         except Exception as e:
-            raise Exception(f"Error saving story: {str(e)}")
+            raise DatabaseError(f"Error saving story: {str(e)}", operation="save_story") from e
+
+    def save_stories_bulk(self, stories: List[StoryDB], return_rows: bool = True) -> List[StoryDB]:
+        """Save several stories with a single INSERT.
+        
+        Args:
+            stories: The stories to save
+            return_rows: Whether to return the saved stories; pass False when
+                they are not needed so Supabase does not send the rows back
+            
+        Returns:
+            The saved stories with IDs and timestamps, in input order
+            (empty if return_rows is False)
+        """
+        if not stories:
+            return []
+        
+        try:
+            rows = [_map_story_for_write(story) for story in stories]
+            
+            # Columns missing from a row (e.g. an unset ID) use the column
+            # default instead of NULL
+            response = self._stories_tbl.insert(
+                rows,
+                returning=ReturnMethod.representation if return_rows else ReturnMethod.minimal,
+                default_to_null=False,
+            ).execute()
+            
+            if not return_rows:
+                return []
+            if len(response.data) != len(rows):
+                raise Exception("Failed to save stories")
+            return _STORIES_ADAPTER.validate_python(response.data)
+        except Exception as e:
+            raise DatabaseError(f"Error saving stories: {str(e)}", operation="save_stories_bulk") from e
 
     def get_story(self, story_id: str, user_id: Optional[str] = None) -> Optional[StoryDB]:
         """Retrieve a story by ID.
@@ -596,56 +592,16 @@ class SupabaseClient:
             The story if found, None otherwise
         """
         try:
-            query = self.client.table("stories").select("*").eq("id", story_id)
+            query = self._stories_tbl.select("*").eq("id", story_id)
             if user_id:
                 query = query.eq("user_id", user_id)
-            response = query.execute()
+            response = query.maybe_single().execute()
             
-            if response.data:
-                story_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                key_mapping = {
-                    'child_id': 'child_id',
-                    'child_name': 'child_name',
-                    'age_category': 'age_category',
-                    'child_gender': 'child_gender',
-                    'child_interests': 'child_interests',
-                    'story_type': 'story_type',
-                    'hero_id': 'hero_id',
-                    'hero_name': 'hero_name',
-                    'hero_gender': 'hero_gender',
-                    'hero_appearance': 'hero_appearance',
-                    'relationship_description': 'relationship_description',
-                    'created_at': 'created_at',
-                    'updated_at': 'updated_at',
-                    'id': 'id',
-                    'title': 'title',
-                    'content': 'content',
-                    'summary': 'summary',
-                    'moral': 'moral',
-                    'model_used': 'model_used',
-                    'language': 'language',
-                    'rating': 'rating',
-                    'story_length': 'story_length',
-                    'audio_file_url': 'audio_file_url',
-                    'audio_provider': 'audio_provider',
-                    'audio_generation_metadata': 'audio_generation_metadata',
-                    'user_id': 'user_id',
-                    'status': 'status',
-                    'generation_id': 'generation_id',
-                    'parent_id': 'parent_id',
-                    'theme': 'theme',
-                }
-                
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
-                return StoryDB(**model_story_data)
-            return None
+            if response is None:
+                return None
+            return StoryDB.model_validate(response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving story: {str(e)}")
+            raise DatabaseError(f"Error retrieving story: {str(e)}", operation="get_story") from e
 
     def get_stories_by_child(self, child_name: str, user_id: Optional[str] = None) -> List[StoryDB]:
         """Retrieve all stories for a specific child.
@@ -658,55 +614,14 @@ class SupabaseClient:
             List of stories for the child
         """
         try:
-            query = self.client.table("stories").select("*").eq("child_name", child_name)
+            query = self._stories_tbl.select(_STORY_COLUMNS).eq("child_name", child_name)
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
             
-            stories = []
-            key_mapping = {
-                'child_id': 'child_id',
-                'child_name': 'child_name',
-                'age_category': 'age_category',
-                'child_gender': 'child_gender',
-                'child_interests': 'child_interests',
-                'hero_id': 'hero_id',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'title': 'title',
-                'content': 'content',
-                'summary': 'summary',
-                'moral': 'moral',
-                'full_response': 'full_response',
-                'generation_info': 'generation_info',
-                'language': 'language',
-                'rating': 'rating',
-                'story_length': 'story_length',
-                'audio_file_url': 'audio_file_url',
-                'audio_provider': 'audio_provider',
-                'audio_generation_metadata': 'audio_generation_metadata',
-                'user_id': 'user_id',
-                'theme': 'theme',
-            }
-            
-            for story_data in response.data:
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
-                # Only append if we have the required fields
-                if all(key in model_story_data for key in ['title', 'content', 'moral']):
-                    try:
-                        stories.append(StoryDB(**model_story_data))
-                    except Exception as e:
-                        logger.warning(f"Skipping story due to validation error: {str(e)}")
-                        continue
-            
-            return stories
+            return _validate_rows(_STORIES_ADAPTER, StoryDB, response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving stories: {str(e)}")
+            raise DatabaseError(f"Error retrieving stories: {str(e)}", operation="get_stories_by_child") from e
 
     def get_stories_by_child_id(self, child_id: str, user_id: Optional[str] = None) -> List[StoryDB]:
         """Retrieve all stories for a specific child by child ID.
@@ -719,53 +634,14 @@ class SupabaseClient:
             List of stories for the child
         """
         try:
-            query = self.client.table("stories").select("*").eq("child_id", child_id)
+            query = self._stories_tbl.select(_STORY_COLUMNS).eq("child_id", child_id)
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
             
-            stories = []
-            key_mapping = {
-                'child_id': 'child_id',
-                'child_name': 'child_name',
-                'age_category': 'age_category',
-                'child_gender': 'child_gender',
-                'child_interests': 'child_interests',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'title': 'title',
-                'content': 'content',
-                'summary': 'summary',
-                'moral': 'moral',
-                'model_used': 'model_used',
-                'full_response': 'full_response',
-                'generation_info': 'generation_info',
-                'language': 'language',
-                'rating': 'rating',
-                'story_length': 'story_length',
-                'generation_id': 'generation_id',
-                'user_id': 'user_id',
-                'theme': 'theme',
-            }
-            
-            for story_data in response.data:
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
-                # Only append if we have the required fields
-                if all(key in model_story_data for key in ['title', 'content', 'moral']):
-                    try:
-                        stories.append(StoryDB(**model_story_data))
-                    except Exception as e:
-                        logger.warning(f"Skipping story due to validation error: {str(e)}")
-                        continue
-            
-            return stories
+            return _validate_rows(_STORIES_ADAPTER, StoryDB, response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving stories: {str(e)}")
+            raise DatabaseError(f"Error retrieving stories: {str(e)}", operation="get_stories_by_child_id") from e
 
     def get_all_stories(self, user_id: Optional[str] = None) -> List[StoryDB]:
         """Retrieve all stories.
@@ -777,64 +653,14 @@ class SupabaseClient:
             List of all stories (filtered by user_id if provided)
         """
         try:
-            query = self.client.table("stories").select("*")
+            query = self._stories_tbl.select(_STORY_COLUMNS)
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
             
-            stories = []
-            key_mapping = {
-                'child_id': 'child_id',
-                'child_name': 'child_name',
-                'age_category': 'age_category',
-                'child_gender': 'child_gender',
-                'child_interests': 'child_interests',
-                'story_type': 'story_type',
-                'hero_id': 'hero_id',
-                'hero_name': 'hero_name',
-                'hero_gender': 'hero_gender',
-                'hero_appearance': 'hero_appearance',
-                'relationship_description': 'relationship_description',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'title': 'title',
-                'content': 'content',
-                'summary': 'summary',
-                'moral': 'moral',
-                'model_used': 'model_used',
-                'full_response': 'full_response',
-                'generation_info': 'generation_info',
-                'language': 'language',
-                'rating': 'rating',
-                'story_length': 'story_length',
-                'audio_file_url': 'audio_file_url',
-                'audio_provider': 'audio_provider',
-                'audio_generation_metadata': 'audio_generation_metadata',
-                'user_id': 'user_id',
-                'status': 'status',
-                'generation_id': 'generation_id',
-                'parent_id': 'parent_id',
-                'theme': 'theme',
-            }
-            
-            for story_data in response.data:
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
-                # Only append if we have the required fields
-                if all(key in model_story_data for key in ['title', 'content', 'moral']):
-                    try:
-                        stories.append(StoryDB(**model_story_data))
-                    except Exception as e:
-                        logger.warning(f"Skipping story due to validation error: {str(e)}")
-                        continue
-            
-            return stories
+            return _validate_rows(_STORIES_ADAPTER, StoryDB, response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving stories: {str(e)}")
+            raise DatabaseError(f"Error retrieving stories: {str(e)}", operation="get_all_stories") from e
 
     def get_stories_by_language(self, language: str, user_id: Optional[str] = None) -> List[StoryDB]:
         """Retrieve all stories for a specific language.
@@ -847,64 +673,14 @@ class SupabaseClient:
             List of stories in the specified language
         """
         try:
-            query = self.client.table("stories").select("*").eq("language", language)
+            query = self._stories_tbl.select(_STORY_COLUMNS).eq("language", language)
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
             
-            stories = []
-            key_mapping = {
-                'child_id': 'child_id',
-                'child_name': 'child_name',
-                'age_category': 'age_category',
-                'child_gender': 'child_gender',
-                'child_interests': 'child_interests',
-                'story_type': 'story_type',
-                'hero_id': 'hero_id',
-                'hero_name': 'hero_name',
-                'hero_gender': 'hero_gender',
-                'hero_appearance': 'hero_appearance',
-                'relationship_description': 'relationship_description',
-                'created_at': 'created_at',
-                'updated_at': 'updated_at',
-                'id': 'id',
-                'title': 'title',
-                'content': 'content',
-                'summary': 'summary',
-                'moral': 'moral',
-                'model_used': 'model_used',
-                'full_response': 'full_response',
-                'generation_info': 'generation_info',
-                'language': 'language',
-                'rating': 'rating',
-                'story_length': 'story_length',
-                'audio_file_url': 'audio_file_url',
-                'audio_provider': 'audio_provider',
-                'audio_generation_metadata': 'audio_generation_metadata',
-                'user_id': 'user_id',
-                'status': 'status',
-                'generation_id': 'generation_id',
-                'parent_id': 'parent_id',
-                'theme': 'theme',
-            }
-            
-            for story_data in response.data:
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
-                # Only append if we have the required fields
-                if all(key in model_story_data for key in ['title', 'content', 'moral']):
-                    try:
-                        stories.append(StoryDB(**model_story_data))
-                    except Exception as e:
-                        logger.warning(f"Skipping story due to validation error: {str(e)}")
-                        continue
-            
-            return stories
+            return _validate_rows(_STORIES_ADAPTER, StoryDB, response.data)
         except Exception as e:
-            raise Exception(f"Error retrieving stories: {str(e)}")
+            raise DatabaseError(f"Error retrieving stories: {str(e)}", operation="get_stories_by_language") from e
 
     def update_story_rating(self, story_id: str, rating: int, user_id: Optional[str] = None) -> Optional[StoryDB]:
         """Update the rating of a story.
@@ -925,60 +701,24 @@ class SupabaseClient:
             logger.debug(f"Updating rating for story {story_id} to {rating}")
             
             # Update the story rating
-            query = self.client.table("stories").update({
+            query = self._stories_tbl.update({
                 "rating": rating,
                 "updated_at": "NOW()"
             }).eq("id", story_id)
             if user_id:
                 query = query.eq("user_id", user_id)
-            response = query.execute()
+            response = query.select(_STORY_COLUMNS).execute()
             
             if response.data:
                 # Return the updated story
-                story_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                key_mapping = {
-                    'child_id': 'child_id',
-                    'child_name': 'child_name',
-                    'age_category': 'age_category',
-                    'child_gender': 'child_gender',
-                    'child_interests': 'child_interests',
-                    'created_at': 'created_at',
-                    'updated_at': 'updated_at',
-                    'id': 'id',
-                    'title': 'title',
-                    'content': 'content',
-                    'summary': 'summary',
-                    'moral': 'moral',
-                    'model_used': 'model_used',
-                    'full_response': 'full_response',
-                    'generation_info': 'generation_info',
-                    'language': 'language',
-                    'rating': 'rating',
-                    'story_length': 'story_length',
-                    'audio_file_url': 'audio_file_url',
-                    'audio_provider': 'audio_provider',
-                    'audio_generation_metadata': 'audio_generation_metadata',
-                    'user_id': 'user_id',
-                    'status': 'status',
-                    'generation_id': 'generation_id',
-                    'parent_id': 'parent_id',
-                    'theme': 'theme',
-                }
-                
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
                 logger.info(f"Successfully updated rating for story {story_id}")
-                return StoryDB(**model_story_data)
+                return StoryDB.model_validate(response.data[0])
             else:
                 logger.warning(f"No story found with ID {story_id}")
                 return None
         except Exception as e:
             logger.error(f"Error updating story rating: {str(e)}", exc_info=True)
-            raise Exception(f"Error updating story rating: {str(e)}")
+            raise DatabaseError(f"Error updating story rating: {str(e)}", operation="update_story_rating") from e
 
     def update_story_status(self, story_id: str, status: str, user_id: Optional[str] = None) -> Optional[StoryDB]:
         """Update the status of a story.
@@ -999,66 +739,24 @@ class SupabaseClient:
             logger.debug(f"Updating status for story {story_id} to {status}")
             
             # Update the story status
-            query = self.client.table("stories").update({
+            query = self._stories_tbl.update({
                 "status": status,
                 "updated_at": "NOW()"
             }).eq("id", story_id)
             if user_id:
                 query = query.eq("user_id", user_id)
-            response = query.execute()
+            response = query.select(_STORY_COLUMNS).execute()
             
             if response.data:
                 # Return the updated story
-                story_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                key_mapping = {
-                    'child_id': 'child_id',
-                    'child_name': 'child_name',
-                    'age_category': 'age_category',
-                    'child_gender': 'child_gender',
-                    'child_interests': 'child_interests',
-                    'story_type': 'story_type',
-                    'hero_id': 'hero_id',
-                    'hero_name': 'hero_name',
-                    'hero_gender': 'hero_gender',
-                    'hero_appearance': 'hero_appearance',
-                    'relationship_description': 'relationship_description',
-                    'created_at': 'created_at',
-                    'updated_at': 'updated_at',
-                    'id': 'id',
-                    'title': 'title',
-                    'content': 'content',
-                    'summary': 'summary',
-                    'moral': 'moral',
-                    'model_used': 'model_used',
-                    'full_response': 'full_response',
-                    'generation_info': 'generation_info',
-                    'language': 'language',
-                    'rating': 'rating',
-                    'story_length': 'story_length',
-                    'audio_file_url': 'audio_file_url',
-                    'audio_provider': 'audio_provider',
-                    'audio_generation_metadata': 'audio_generation_metadata',
-                    'user_id': 'user_id',
-                    'status': 'status',
-                    'generation_id': 'generation_id',
-                    'parent_id': 'parent_id',
-                    'theme': 'theme',
-                }
-                
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
                 logger.info(f"Successfully updated status for story {story_id}")
-                return StoryDB(**model_story_data)
+                return StoryDB.model_validate(response.data[0])
             else:
                 logger.warning(f"No story found with ID {story_id}")
                 return None
         except Exception as e:
             logger.error(f"Error updating story status: {str(e)}", exc_info=True)
-            raise Exception(f"Error updating story status: {str(e)}")
+            raise DatabaseError(f"Error updating story status: {str(e)}", operation="update_story_status") from e
 
     def update_story_audio(
         self,
@@ -1096,60 +794,21 @@ class SupabaseClient:
                 update_data["audio_generation_metadata"] = audio_metadata
             
             # Update the story audio
-            query = self.client.table("stories").update(update_data).eq("id", story_id)
+            query = self._stories_tbl.update(update_data).eq("id", story_id)
             if user_id:
                 query = query.eq("user_id", user_id)
-            response = query.execute()
+            response = query.select(_STORY_COLUMNS).execute()
             
             if response.data:
                 # Return the updated story
-                story_data = response.data[0]
-                # Map snake_case keys back to camelCase keys for the model
-                key_mapping = {
-                    'child_id': 'child_id',
-                    'child_name': 'child_name',
-                    'age_category': 'age_category',
-                    'child_gender': 'child_gender',
-                    'child_interests': 'child_interests',
-                    'story_type': 'story_type',
-                    'hero_id': 'hero_id',
-                    'hero_name': 'hero_name',
-                    'hero_gender': 'hero_gender',
-                    'hero_appearance': 'hero_appearance',
-                    'relationship_description': 'relationship_description',
-                    'created_at': 'created_at',
-                    'updated_at': 'updated_at',
-                    'id': 'id',
-                    'title': 'title',
-                    'content': 'content',
-                    'summary': 'summary',
-                    'generation_id': 'generation_id',
-                    'moral': 'moral',
-                    'language': 'language',
-                    'rating': 'rating',
-                    'story_length': 'story_length',
-                    'audio_file_url': 'audio_file_url',
-                    'audio_provider': 'audio_provider',
-                    'audio_generation_metadata': 'audio_generation_metadata',
-                    'user_id': 'user_id',
-                    'status': 'status',
-                    'parent_id': 'parent_id',
-                    'theme': 'theme',
-                }
-                
-                model_story_data = {}
-                for db_key, py_key in key_mapping.items():
-                    if db_key in story_data:
-                        model_story_data[py_key] = story_data[db_key]
-                
                 logger.info(f"Successfully updated audio for story {story_id}")
-                return StoryDB(**model_story_data)
+                return StoryDB.model_validate(response.data[0])
             else:
                 logger.warning(f"No story found with ID {story_id}")
                 return None
         except Exception as e:
             logger.error(f"Error updating story audio: {str(e)}", exc_info=True)
-            raise Exception(f"Error updating story audio: {str(e)}")
+            raise DatabaseError(f"Error updating story audio: {str(e)}", operation="update_story_audio") from e
 
     def delete_story(self, story_id: str, user_id: Optional[str] = None) -> bool:
         """Delete a story by ID.
@@ -1162,13 +821,13 @@ class SupabaseClient:
             True if deleted, False otherwise
         """
         try:
-            query = self.client.table("stories").delete().eq("id", story_id)
+            query = self._stories_tbl.delete().eq("id", story_id)
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
             return len(response.data) > 0
         except Exception as e:
-            raise Exception(f"Error deleting story: {str(e)}")
+            raise DatabaseError(f"Error deleting story: {str(e)}", operation="delete_story") from e
 
     def delete_child(self, child_id: str, user_id: Optional[str] = None) -> bool:
         """Delete a child by ID.
@@ -1181,13 +840,15 @@ class SupabaseClient:
             True if deleted, False otherwise
         """
         try:
-            query = self.client.table("children").delete().eq("id", child_id)
+            query = self._children_tbl.delete().eq("id", child_id)
             if user_id:
                 query = query.eq("user_id", user_id)
             response = query.execute()
+            if response.data:
+                _CHILD_CACHE.pop(child_id)
             return len(response.data) > 0
         except Exception as e:
-            raise Exception(f"Error deleting child: {str(e)}")
+            raise DatabaseError(f"Error deleting child: {str(e)}", operation="delete_child") from e
     
     # Generation operations
     def create_generation(self, generation: GenerationDB) -> GenerationDB:
@@ -1215,7 +876,7 @@ class SupabaseClient:
             else:
                 raise Exception("Failed to create generation")
         except Exception as e:
-            raise Exception(f"Error creating generation: {str(e)}")
+            raise DatabaseError(f"Error creating generation: {str(e)}", operation="create_generation") from e
     
     def update_generation(self, generation: GenerationDB) -> GenerationDB:
         """Update an existing generation record.
@@ -1246,7 +907,7 @@ class SupabaseClient:
             else:
                 raise Exception("Failed to update generation")
         except Exception as e:
-            raise Exception(f"Error updating generation: {str(e)}")
+            raise DatabaseError(f"Error updating generation: {str(e)}", operation="update_generation") from e
     
     def get_generation(self, generation_id: str, attempt_number: int) -> Optional[GenerationDB]:
         """Get a specific generation attempt.
@@ -1269,7 +930,7 @@ class SupabaseClient:
                 return GenerationDB(**response.data[0])
             return None
         except Exception as e:
-            raise Exception(f"Error retrieving generation: {str(e)}")
+            raise DatabaseError(f"Error retrieving generation: {str(e)}", operation="get_generation") from e
     
     def get_latest_attempt(self, generation_id: str) -> Optional[GenerationDB]:
         """Get the latest attempt for a generation.
@@ -1296,7 +957,7 @@ class SupabaseClient:
             return None
         except Exception as e:
             logger.error(f"Error retrieving latest attempt for {generation_id}: {str(e)}", exc_info=True)
-            raise Exception(f"Error retrieving latest attempt: {str(e)}")
+            raise DatabaseError(f"Error retrieving latest attempt: {str(e)}", operation="get_latest_attempt") from e
     
     def get_all_attempts(self, generation_id: str) -> List[GenerationDB]:
         """Get all attempts for a generation.
@@ -1326,7 +987,7 @@ class SupabaseClient:
             return attempts
         except Exception as e:
             logger.error(f"Error retrieving all attempts for {generation_id}: {str(e)}", exc_info=True)
-            raise Exception(f"Error retrieving all attempts: {str(e)}")
+            raise DatabaseError(f"Error retrieving all attempts: {str(e)}", operation="get_all_attempts") from e
     
     def get_user_generations(self, user_id: str, limit: int = 50) -> List[GenerationDB]:
         """Get all generations for a user.
@@ -1347,7 +1008,7 @@ class SupabaseClient:
             
             return [GenerationDB(**gen) for gen in response.data]
         except Exception as e:
-            raise Exception(f"Error retrieving user generations: {str(e)}")
+            raise DatabaseError(f"Error retrieving user generations: {str(e)}", operation="get_user_generations") from e
     
     def get_generations_by_status(self, status: str, limit: int = 50) -> List[GenerationDB]:
         """Get generations by status.
@@ -1368,7 +1029,7 @@ class SupabaseClient:
             
             return [GenerationDB(**gen) for gen in response.data]
         except Exception as e:
-            raise Exception(f"Error retrieving generations by status: {str(e)}")
+            raise DatabaseError(f"Error retrieving generations by status: {str(e)}", operation="get_generations_by_status") from e
     
     def get_all_generations(
         self, 
@@ -1413,7 +1074,7 @@ class SupabaseClient:
             return generations
         except Exception as e:
             logger.error(f"Error retrieving all generations: {str(e)}", exc_info=True)
-            raise Exception(f"Error retrieving all generations: {str(e)}")
+            raise DatabaseError(f"Error retrieving all generations: {str(e)}", operation="get_all_generations") from e
     
     # Subscription and Usage Tracking Methods
     
@@ -1426,6 +1087,9 @@ class SupabaseClient:
         Returns:
             UserSubscription object or None if not found
         """
+        cached = _SUBSCRIPTION_CACHE.get(user_id)
+        if cached is not None:
+            return replace(cached)
         try:
             response = self.client.table("user_profiles").select("*").eq("id", user_id).execute()
             
@@ -1520,7 +1184,7 @@ class SupabaseClient:
             
             profile = response.data[0]
             
-            return UserSubscription(
+            subscription = UserSubscription(
                 user_id=user_id,
                 plan=SubscriptionPlan(profile.get('subscription_plan', 'free')),
                 status=SubscriptionStatus(profile.get('subscription_status', 'active')),
@@ -1529,9 +1193,11 @@ class SupabaseClient:
                 monthly_story_count=profile.get('monthly_story_count', 0),
                 last_reset_date=datetime.fromisoformat(profile['last_reset_date']) if profile.get('last_reset_date') else datetime.now()
             )
+            _SUBSCRIPTION_CACHE.set(user_id, subscription)
+            return replace(subscription)
         except Exception as e:
             logger.error(f"Error retrieving user subscription: {str(e)}")
-            raise Exception(f"Error retrieving user subscription: {str(e)}")
+            raise DatabaseError(f"Error retrieving user subscription: {str(e)}", operation="get_user_subscription") from e
     
     def reset_monthly_story_count(self, user_id: str) -> None:
         """Reset monthly story count for a user.
@@ -1542,33 +1208,33 @@ class SupabaseClient:
         try:
             # Call the database function to check and reset
             self.client.rpc('check_and_reset_monthly_counter', {'p_user_id': user_id}).execute()
+            _SUBSCRIPTION_CACHE.pop(user_id)
             logger.info(f"Monthly story count reset check completed for user {user_id}")
         except Exception as e:
             logger.error(f"Error resetting monthly story count: {str(e)}")
-            raise Exception(f"Error resetting monthly story count: {str(e)}")
+            raise DatabaseError(f"Error resetting monthly story count: {str(e)}", operation="reset_monthly_story_count") from e
     
     def increment_story_count(self, user_id: str) -> None:
         """Increment monthly story count for a user.
         
+        The counter is reset first if the last reset was in an earlier month,
+        so callers do not need to call reset_monthly_story_count beforehand.
+        
         Args:
             user_id: The user ID
         """
         try:
-            response = self.client.table("user_profiles").select("monthly_story_count").eq("id", user_id).execute()
+            # Single UPDATE on the server, so concurrent increments are not lost
+            response = self.client.rpc('reset_and_increment_monthly_counter', {'p_user_id': user_id}).execute()
+            _SUBSCRIPTION_CACHE.pop(user_id)
             
-            if not response.data:
+            if response.data is None:
                 raise Exception(f"User profile not found for user {user_id}")
             
-            current_count = response.data[0].get('monthly_story_count', 0)
-            
-            self.client.table("user_profiles").update({
-                'monthly_story_count': current_count + 1
-            }).eq('id', user_id).execute()
-            
-            logger.info(f"Incremented story count for user {user_id} to {current_count + 1}")
+            logger.info(f"Incremented story count for user {user_id} to {response.data}")
         except Exception as e:
             logger.error(f"Error incrementing story count: {str(e)}")
-            raise Exception(f"Error incrementing story count: {str(e)}")
+            raise DatabaseError(f"Error incrementing story count: {str(e)}", operation="increment_story_count") from e
     
     def track_usage(self, user_id: str, action_type: str, resource_id: Optional[str] = None, metadata: Optional[dict] = None) -> None:
         """Track user action in usage_tracking table.
@@ -1604,11 +1270,11 @@ class SupabaseClient:
             Number of child profiles
         """
         try:
-            response = self.client.table("children").select("id", count="exact").eq("user_id", user_id).execute()
+            response = self._children_tbl.select("id", count="exact").eq("user_id", user_id).execute()
             return response.count if response.count is not None else 0
         except Exception as e:
             logger.error(f"Error counting user children: {str(e)}")
-            raise Exception(f"Error counting user children: {str(e)}")
+            raise DatabaseError(f"Error counting user children: {str(e)}", operation="count_user_children") from e
     
     # Purchase transaction methods
     
@@ -1631,7 +1297,7 @@ class SupabaseClient:
             return response.data[0]
         except Exception as e:
             logger.error(f"Error creating purchase transaction: {str(e)}")
-            raise Exception(f"Error creating purchase transaction: {str(e)}")
+            raise DatabaseError(f"Error creating purchase transaction: {str(e)}", operation="create_purchase_transaction") from e
     
     def get_purchase_transaction(self, transaction_id: str, user_id: str) -> Optional[dict]:
         """Get a purchase transaction by ID.
@@ -1652,7 +1318,7 @@ class SupabaseClient:
             return response.data[0]
         except Exception as e:
             logger.error(f"Error retrieving purchase transaction: {str(e)}")
-            raise Exception(f"Error retrieving purchase transaction: {str(e)}")
+            raise DatabaseError(f"Error retrieving purchase transaction: {str(e)}", operation="get_purchase_transaction") from e
     
     def get_user_purchase_history(
         self,
@@ -1689,7 +1355,7 @@ class SupabaseClient:
             }
         except Exception as e:
             logger.error(f"Error retrieving purchase history: {str(e)}")
-            raise Exception(f"Error retrieving purchase history: {str(e)}")
+            raise DatabaseError(f"Error retrieving purchase history: {str(e)}", operation="get_user_purchase_history") from e
     
     def update_subscription_plan(
         self,
@@ -1722,6 +1388,7 @@ class SupabaseClient:
                 update_data['subscription_end_date'] = end_date.isoformat()
             
             response = self.client.table("user_profiles").update(update_data).eq("id", user_id).execute()
+            _SUBSCRIPTION_CACHE.pop(user_id)
             
             if not response.data:
                 raise Exception(f"Failed to update subscription for user {user_id}")
@@ -1730,7 +1397,7 @@ class SupabaseClient:
             return response.data[0]
         except Exception as e:
             logger.error(f"Error updating subscription: {str(e)}")
-            raise Exception(f"Error updating subscription: {str(e)}")
+            raise DatabaseError(f"Error updating subscription: {str(e)}", operation="update_subscription_plan") from e
     
     # Free stories methods (public, no RLS)
     
@@ -1798,7 +1465,7 @@ class SupabaseClient:
             return free_stories
         except Exception as e:
             logger.error(f"Error retrieving free stories: {str(e)}")
-            raise Exception(f"Error retrieving free stories: {str(e)}")
+            raise DatabaseError(f"Error retrieving free stories: {str(e)}", operation="get_free_stories") from e
     
     def get_free_story(self, story_id: str) -> Optional[FreeStoryDB]:
         """Get a free story by ID.
@@ -1841,7 +1508,7 @@ class SupabaseClient:
             return None
         except Exception as e:
             logger.error(f"Error retrieving free story: {str(e)}")
-            raise Exception(f"Error retrieving free story: {str(e)}")
+            raise DatabaseError(f"Error retrieving free story: {str(e)}", operation="get_free_story") from e
     
     def get_prompts(self, language: str, story_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get prompts from the database.
@@ -1992,7 +1659,7 @@ class SupabaseClient:
             
         except Exception as e:
             logger.error(f"Error retrieving daily free stories: {str(e)}")
-            raise Exception(f"Error retrieving daily free stories: {str(e)}")
+            raise DatabaseError(f"Error retrieving daily free stories: {str(e)}", operation="get_daily_stories") from e
     
     def get_daily_story_by_date(
         self,
@@ -2055,7 +1722,7 @@ class SupabaseClient:
             return None
         except Exception as e:
             logger.error(f"Error retrieving daily free story by date: {str(e)}")
-            raise Exception(f"Error retrieving daily free story by date: {str(e)}")
+            raise DatabaseError(f"Error retrieving daily free story by date: {str(e)}", operation="get_daily_story_by_date") from e
     
     def get_daily_story_by_id(
         self,
@@ -2118,7 +1785,7 @@ class SupabaseClient:
             return None
         except Exception as e:
             logger.error(f"Error retrieving daily free story by ID: {str(e)}")
-            raise Exception(f"Error retrieving daily free story by ID: {str(e)}")
+            raise DatabaseError(f"Error retrieving daily free story by ID: {str(e)}", operation="get_daily_story_by_id") from e
     
     # Daily story reactions methods
     
@@ -2259,4 +1926,4 @@ class SupabaseClient:
             )
         except Exception as e:
             logger.error(f"Error creating/updating reaction: {str(e)}")
-            raise Exception(f"Error creating/updating reaction: {str(e)}")
\ No newline at end of file
+            raise DatabaseError(f"Error creating/updating reaction: {str(e)}", operation="create_or_update_reaction") from e
\ No newline at end of file
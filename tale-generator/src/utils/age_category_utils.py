@@ -1,10 +1,31 @@
 """Utilities for age category handling and translation."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 from src.domain.value_objects import Language
 
 
+# Display text per language for the standard age categories
+_AGE_CATEGORY_DISPLAY = {
+    Language.ENGLISH: {
+        '2-3': '2-3 years',
+        '3-5': '3-5 years',
+        '5-7': '5-7 years',
+        '8-12': '9+ years'
+    },
+    Language.RUSSIAN: {
+        '2-3': '2-3 года',
+        '3-5': '3-5 лет',
+        '5-7': '5-7 лет',
+        '8-12': '9+ лет'
+    }
+}
+
+# Fallback for unsupported languages, resolved once at import time
+_DEFAULT_AGE_CATEGORY_DISPLAY = _AGE_CATEGORY_DISPLAY[Language.ENGLISH]
+
+
 def normalize_age_category(age_category: str) -> str:
     """Normalize age category string to standard format (e.g., '2-3 года' -> '2-3').
     
@@ -68,30 +89,19 @@ def get_age_category_display(age_category: str, language: Language = Language.EN
     Returns:
         Display text for the age category
     """
-    translations = {
-        Language.ENGLISH: {
-            '2-3': '2-3 years',
-            '3-5': '3-5 years',
-            '5-7': '5-7 years',
-            '8-12': '9+ years'
-        },
-        Language.RUSSIAN: {
-            '2-3': '2-3 года',
-            '3-5': '3-5 лет',
-            '5-7': '5-7 лет',
-            '8-12': '9+ лет'
-        }
-    }
-    
-    return translations.get(language, translations[Language.ENGLISH]).get(
+    return _AGE_CATEGORY_DISPLAY.get(language, _DEFAULT_AGE_CATEGORY_DISPLAY).get(
         age_category, 
         age_category
     )
 
 
+@lru_cache(maxsize=64)
 def get_age_category_for_prompt(age_category: str, language: Language = Language.ENGLISH) -> str:
     """Get age category text for use in prompts.
     
+    Memoized: there are only a handful of age categories per language and
+    this runs on every prompt render.
+    
     Args:
         age_category: Age category (normalized format like '2-3', '4-5', '8-12', or '8+')
         language: Target language
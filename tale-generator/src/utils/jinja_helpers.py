@@ -1,12 +1,27 @@
-"""Jinja2 template filters and helpers for prompt rendering."""
+"""Jinja2 template filters and helpers for prompt rendering.
 
-from typing import List
+The scalar translation filters are pure functions of (value, language) and
+run on every prompt render, so they are memoized with ``lru_cache``.
+"""
+
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 from src.domain.value_objects import Language
 from src.utils.age_category_utils import get_age_category_for_prompt
 
 
+def _freeze(tables: Dict[Language, Dict[str, str]]) -> Mapping[Language, Mapping[str, str]]:
+    """Make a per-language translation table read-only, interning its values."""
+    return MappingProxyType({
+        language: MappingProxyType({key: sys.intern(value) for key, value in translations.items()})
+        for language, translations in tables.items()
+    })
+
+
 # Moral translations
-MORAL_TRANSLATIONS = {
+MORAL_TRANSLATIONS = _freeze({
     Language.ENGLISH: {
         "kindness": "kindness",
         "honesty": "honesty",
@@ -27,10 +42,10 @@ MORAL_TRANSLATIONS = {
         "respect": "уважение",
         "responsibility": "ответственность"
     }
-}
+})
 
 # Gender translations
-GENDER_TRANSLATIONS = {
+GENDER_TRANSLATIONS = _freeze({
     Language.ENGLISH: {
         "male": "male",
         "female": "female",
@@ -41,10 +56,23 @@ GENDER_TRANSLATIONS = {
         "female": "девочка",
         "other": "ребенок"
     }
+})
+
+# Flat (language, value) -> translation views of the tables above, so each
+# filter call is a single plain-dict lookup (no proxy indirection)
+_MORAL_BY_LANGUAGE = {
+    (language, moral): translation
+    for language, translations in MORAL_TRANSLATIONS.items()
+    for moral, translation in translations.items()
+}
+_GENDER_BY_LANGUAGE = {
+    (language, gender): translation
+    for language, translations in GENDER_TRANSLATIONS.items()
+    for gender, translation in translations.items()
 }
 
 # Theme translations (API sends English key; we translate to target language for prompt)
-THEME_TRANSLATIONS = {
+THEME_TRANSLATIONS = _freeze({
     Language.ENGLISH: {
         "adventure": "adventure",
         "space": "space",
@@ -73,10 +101,10 @@ THEME_TRANSLATIONS = {
         "knights": "рыцари",
         "animals": "животные",
     }
-}
+})
 
 # Interest translations
-INTEREST_TRANSLATIONS = {
+INTEREST_TRANSLATIONS = _freeze({
     Language.RUSSIAN: {
         "dinosaurs": "динозавры",
         "space": "космос",
@@ -91,9 +119,10 @@ INTEREST_TRANSLATIONS = {
         "planets": "планеты",
         "trucks": "грузовики"
     }
-}
+})
 
 
+@lru_cache(maxsize=512)
 def translate_moral(moral: str, language: Language) -> str:
     """Translate moral value to target language.
     
@@ -104,11 +133,10 @@ def translate_moral(moral: str, language: Language) -> str:
     Returns:
         Translated moral value
     """
-    moral_lower = moral.lower()
-    translations = MORAL_TRANSLATIONS.get(language, {})
-    return translations.get(moral_lower, moral)
+    return _MORAL_BY_LANGUAGE.get((language, moral.lower()), moral)
 
 
+@lru_cache(maxsize=512)
 def translate_theme(theme: str, language: Language) -> str:
     """Translate story theme to target language.
     
@@ -129,6 +157,7 @@ def translate_theme(theme: str, language: Language) -> str:
     return translations.get(theme_lower, theme)
 
 
+@lru_cache(maxsize=512)
 def translate_gender(gender: str, language: Language) -> str:
     """Translate gender to target language.
     
@@ -139,8 +168,7 @@ def translate_gender(gender: str, language: Language) -> str:
     Returns:
         Translated gender value
     """
-    translations = GENDER_TRANSLATIONS.get(language, {})
-    return translations.get(gender.lower(), gender)
+    return _GENDER_BY_LANGUAGE.get((language, gender.lower()), gender)
 
 
 def translate_interests(interests: List[str], language: Language) -> List[str]:
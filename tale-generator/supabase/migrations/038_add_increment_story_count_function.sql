@@ -0,0 +1,17 @@
+-- Migration 038: Add atomic story counter increment function
+-- Description: Increment monthly_story_count in a single statement instead of
+-- reading the count and writing it back, which took two round-trips and could
+-- lose increments when a user generated stories concurrently.
+
+-- Step 1: Create increment function returning the new count (NULL if the profile does not exist)
+CREATE OR REPLACE FUNCTION tales.increment_story_count(p_user_id UUID)
+RETURNS INTEGER AS $$
+    UPDATE tales.user_profiles
+    SET monthly_story_count = COALESCE(monthly_story_count, 0) + 1
+    WHERE id = p_user_id
+    RETURNING monthly_story_count;
+$$ LANGUAGE sql;
+
+-- Step 2: Comment
+COMMENT ON FUNCTION tales.increment_story_count(UUID) IS
+'Atomically increments the monthly story counter for a user and returns the new value';
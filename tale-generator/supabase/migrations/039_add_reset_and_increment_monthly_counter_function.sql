@@ -0,0 +1,29 @@
+-- Migration 039: Add combined monthly counter reset and increment function
+-- Description: Roll the monthly story counter over to a new month and count the
+-- new story in one statement, so story generation no longer needs a separate
+-- check_and_reset_monthly_counter call before incrementing.
+
+-- Step 1: Create function returning the new count (NULL if the profile does not exist).
+-- Same reset rule as check_and_reset_monthly_counter: the counter restarts when
+-- last_reset_date falls in an earlier calendar month.
+CREATE OR REPLACE FUNCTION tales.reset_and_increment_monthly_counter(p_user_id UUID)
+RETURNS INTEGER AS $$
+    UPDATE tales.user_profiles
+    SET monthly_story_count = CASE
+            WHEN TO_CHAR(last_reset_date, 'YYYY-MM') != TO_CHAR(NOW(), 'YYYY-MM') THEN 1
+            ELSE COALESCE(monthly_story_count, 0) + 1
+        END,
+        last_reset_date = CASE
+            WHEN TO_CHAR(last_reset_date, 'YYYY-MM') != TO_CHAR(NOW(), 'YYYY-MM') THEN NOW()
+            ELSE last_reset_date
+        END
+    WHERE id = p_user_id
+    RETURNING monthly_story_count;
+$$ LANGUAGE sql;
+
+-- Step 2: Comment
+COMMENT ON FUNCTION tales.reset_and_increment_monthly_counter(UUID) IS
+'Resets the monthly story counter if a new month started, then increments it and returns the new value';
+
+-- Step 3: Drop the plain increment function from migration 038, which this one replaces
+DROP FUNCTION IF EXISTS tales.increment_story_count(UUID);
@@ -99,6 +99,37 @@ class TestChildCharacter:
         assert data["description"] == "Lily is very kind."
         assert data["character_type"] == "child"
 
+    def test_from_trusted_skips_validation(self):
+        """Test that from_trusted builds a validated child without re-validating."""
+        child = ChildCharacter.from_trusted(
+            name="Lily",
+            age_category="3-5",
+            gender="female",
+            interests=["cats"]
+        )
+        
+        assert child.name == "Lily"
+        assert child.description is None
+        assert child._validated is True
+    
+    def test_description_data_is_cached(self):
+        """Test that description data is built once per character."""
+        child = ChildCharacter(
+            name="Lily",
+            age_category="3-5",
+            gender="female",
+            interests=["cats"]
+        )
+        
+        assert child.get_description_data() is child.get_description_data()
+        assert child.description_data is child.get_description_data()
+    
+    def test_from_trusted_missing_field_fails(self):
+        """Test that from_trusted still requires all mandatory fields."""
+        with pytest.raises(TypeError) as exc_info:
+            ChildCharacter.from_trusted(name="Lily", gender="female", interests=[])
+        assert "age_category" in str(exc_info.value)
+
 
 class TestHeroCharacter:
     """Tests for HeroCharacter class."""
@@ -190,6 +221,8 @@ class TestHeroCharacter:
         assert data["language"] == Language.RUSSIAN
         assert data["description"] == "A powerful ice wizard."
         assert data["character_type"] == "hero"
+        assert data["personality_traits_str"] == "calm, intelligent"
+        assert data["interests_str"] == "magic, ancient runes"
 
 
 class TestCombinedCharacter:
@@ -287,6 +320,30 @@ class TestCombinedCharacter:
         # Should not have duplicates
         assert merged.count("space") == 1
     
+    def test_get_merged_interests_preserves_order(self):
+        """Test that merged interests keep child-then-hero order."""
+        child = ChildCharacter(
+            name="Tom",
+            age_category="5-7",
+            gender="male",
+            interests=["space", "robots"]
+        )
+        
+        hero = HeroCharacter(
+            name="Cosmic Explorer",
+            age=25,
+            gender="male",
+            appearance="Space suit",
+            personality_traits=["adventurous"],
+            strengths=["space travel"],
+            interests=["aliens", "space", "planets"],
+            language=Language.ENGLISH
+        )
+        
+        combined = CombinedCharacter(child=child, hero=hero)
+        
+        assert combined.get_merged_interests() == ["space", "robots", "aliens", "planets"]
+    
     def test_combined_invalid_child_fails(self):
         """Test that invalid child type raises validation error."""
         hero = HeroCharacter(
@@ -341,6 +398,65 @@ class TestCombinedCharacter:
         assert data["relationship"] == "Max befriends the Dino Guardian"
         assert "dinosaurs" in data["merged_interests"]
 
+    def test_description_data_has_flat_view(self):
+        """Test that combined data exposes child/hero fields under template names."""
+        child = ChildCharacter(
+            name="Max",
+            age_category="8-12",
+            gender="male",
+            interests=["dinosaurs"]
+        )
+
+        hero = HeroCharacter(
+            name="Dino Guardian",
+            age=40,
+            gender="male",
+            appearance="Wears dinosaur armor",
+            personality_traits=["protective"],
+            strengths=["dinosaur summoning", "roaring"],
+            interests=["fossils"],
+            language=Language.ENGLISH
+        )
+
+        data = CombinedCharacter(child=child, hero=hero).get_description_data()
+
+        assert data["child_name"] == "Max"
+        assert data["age_category"] == "8-12"
+        assert data["hero_name"] == "Dino Guardian"
+        assert data["hero_strengths_str"] == "dinosaur summoning, roaring"
+        assert data["child"] is child.get_description_data()
+
+    def test_combined_skips_revalidating_characters(self, monkeypatch):
+        """Test that already-validated child and hero are not validated again."""
+        child = ChildCharacter(
+            name="Mia",
+            age_category="3-5",
+            gender="female",
+            interests=["cats"]
+        )
+
+        hero = HeroCharacter(
+            name="Star Knight",
+            age=20,
+            gender="male",
+            appearance="Shining armor",
+            personality_traits=["brave"],
+            strengths=["sword fighting"],
+            interests=["stars"],
+            language=Language.ENGLISH
+        )
+
+        def fail_validate():
+            raise AssertionError("validate() should not be called again")
+
+        monkeypatch.setattr(ChildCharacter, "validate", lambda self: fail_validate())
+        monkeypatch.setattr(HeroCharacter, "validate", lambda self: fail_validate())
+
+        combined = CombinedCharacter(child=child, hero=hero)
+
+        assert combined.child is child
+        assert combined.hero is hero
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,218 @@
+"""Offline unit tests for SupabaseClient write helpers, caches and bulk inserts."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from postgrest import ReturnMethod
+
+from src.core.exceptions import DatabaseError
+from src.models import ChildDB, HeroDB, StoryDB, Language
+from src.prompts_old import Children, get_child_story_prompt
+from src.supabase_client import (
+    SupabaseClient,
+    _TTLCache,
+    _compile_write_mapper,
+    _map_child_for_write,
+    _map_hero_for_write,
+)
+
+
+NOW = datetime(2024, 3, 3, 12, 0, 0)
+
+
+def make_story(title: str = "T") -> StoryDB:
+    """Create a story that has not been saved yet (no ID)."""
+    return StoryDB(
+        title=title,
+        content="C",
+        moral="kindness",
+        generation_id="g1",
+        language=Language.RUSSIAN,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+@pytest.fixture
+def stories_table():
+    """Create a stubbed stories table builder."""
+    return MagicMock()
+
+
+@pytest.fixture
+def client(stories_table):
+    """Create a SupabaseClient without connecting to Supabase."""
+    supabase_client = SupabaseClient.__new__(SupabaseClient)
+    supabase_client._stories_tbl = stories_table
+    return supabase_client
+
+
+class TestWriteMappers:
+    """Test the compiled model -> row mappers."""
+
+    def test_timestamps_are_iso_strings(self):
+        """Test datetime columns are written as ISO strings."""
+        child = ChildDB(name="Emma", age_category="5-7", gender="female", interests=["cats"],
+                        created_at=NOW, updated_at=NOW)
+
+        row = _map_child_for_write(child)
+
+        assert row["created_at"] == NOW.isoformat()
+        assert row["updated_at"] == NOW.isoformat()
+
+    def test_unset_timestamps_stay_none(self):
+        """Test timestamps that are not set are written as None."""
+        child = ChildDB(name="Emma", age_category="5-7", gender="female", interests=["cats"])
+
+        row = _map_child_for_write(child)
+
+        assert row["created_at"] is None
+        assert row["updated_at"] is None
+
+    def test_enum_columns_use_value(self):
+        """Test enum columns are written as their plain values."""
+        hero = HeroDB(name="Cap", gender="male", appearance="cape", personality_traits=["brave"],
+                      interests=["space"], strengths=["fly"], language=Language.RUSSIAN)
+
+        row = _map_hero_for_write(hero)
+
+        assert row["language"] == "ru"
+        assert type(row["language"]) is str
+
+    def test_unset_id_is_dropped(self):
+        """Test an unset ID is left out so the database generates it."""
+        child = ChildDB(name="Emma", age_category="5-7", gender="female", interests=["cats"])
+
+        assert "id" not in _map_child_for_write(child)
+
+    def test_set_id_is_kept(self):
+        """Test an existing ID is written."""
+        child = ChildDB(id="c1", name="Emma", age_category="5-7", gender="female", interests=["cats"])
+
+        assert _map_child_for_write(child)["id"] == "c1"
+
+    def test_only_requested_columns(self):
+        """Test the mapper writes exactly the columns it was built for."""
+        mapper = _compile_write_mapper(("name", "created_at"))
+        child = ChildDB(name="Emma", age_category="5-7", gender="female", interests=["cats"],
+                        created_at=NOW)
+
+        assert mapper(child) == {"name": "Emma", "created_at": NOW.isoformat()}
+
+
+class TestTTLCache:
+    """Test the in-process TTL cache."""
+
+    def test_get_before_expiry(self):
+        """Test a value is returned until its TTL has passed."""
+        with patch("src.supabase_client.time.monotonic", return_value=100.0):
+            cache = _TTLCache(maxsize=2, ttl=15)
+            cache.set("a", 1)
+
+        with patch("src.supabase_client.time.monotonic", return_value=114.0):
+            assert cache.get("a") == 1
+
+    def test_get_after_expiry(self):
+        """Test an expired value is dropped."""
+        with patch("src.supabase_client.time.monotonic", return_value=100.0):
+            cache = _TTLCache(maxsize=2, ttl=15)
+            cache.set("a", 1)
+
+        with patch("src.supabase_client.time.monotonic", return_value=115.0):
+            assert cache.get("a") is None
+            assert "a" not in cache._entries
+
+    def test_evicts_oldest_when_full(self):
+        """Test the oldest entry is evicted when the cache is full."""
+        cache = _TTLCache(maxsize=2, ttl=15)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_overwrite_does_not_evict(self):
+        """Test updating an existing key in a full cache keeps the other entries."""
+        cache = _TTLCache(maxsize=2, ttl=15)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_pop_and_clear(self):
+        """Test entries can be dropped one at a time or all at once."""
+        cache = _TTLCache(maxsize=4, ttl=15)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert cache.get("b") is None
+
+
+class TestSaveStoriesBulk:
+    """Test SupabaseClient.save_stories_bulk."""
+
+    def test_single_insert_with_row_shape(self, client, stories_table):
+        """Test all stories go in one insert that leaves unset IDs to the database."""
+        stories = [make_story("A"), make_story("B")]
+        stories_table.insert.return_value.execute.return_value.data = [
+            {**story.model_dump(mode="json"), "id": f"s{i}"} for i, story in enumerate(stories)
+        ]
+
+        saved = client.save_stories_bulk(stories)
+
+        stories_table.insert.assert_called_once()
+        rows = stories_table.insert.call_args.args[0]
+        kwargs = stories_table.insert.call_args.kwargs
+        assert [row["title"] for row in rows] == ["A", "B"]
+        assert all("id" not in row for row in rows)
+        assert all(row["created_at"] == NOW.isoformat() for row in rows)
+        assert kwargs["default_to_null"] is False
+        assert kwargs["returning"] == ReturnMethod.representation
+        assert [story.id for story in saved] == ["s0", "s1"]
+        assert all(isinstance(story, StoryDB) for story in saved)
+
+    def test_minimal_return(self, client, stories_table):
+        """Test return_rows=False asks Supabase not to send the rows back."""
+        stories_table.insert.return_value.execute.return_value.data = []
+
+        assert client.save_stories_bulk([make_story()], return_rows=False) == []
+        assert stories_table.insert.call_args.kwargs["returning"] == ReturnMethod.minimal
+
+    def test_row_count_mismatch(self, client, stories_table):
+        """Test fewer returned rows than stories is reported as a database error."""
+        stories_table.insert.return_value.execute.return_value.data = [
+            {**make_story().model_dump(mode="json"), "id": "s0"}
+        ]
+
+        with pytest.raises(DatabaseError, match="Error saving stories"):
+            client.save_stories_bulk([make_story("A"), make_story("B")])
+
+    def test_empty_list_skips_request(self, client, stories_table):
+        """Test saving no stories makes no request."""
+        assert client.save_stories_bulk([]) == []
+        stories_table.insert.assert_not_called()
+
+
+class TestLegacyChildPrompt:
+    """Regression tests for the legacy (prompts_old) child prompts."""
+
+    @pytest.mark.parametrize("language", [Language.ENGLISH, Language.RUSSIAN])
+    def test_child_prompt_uses_age(self, language):
+        """Test child prompts render from the legacy Child, which has age but no age_category."""
+        child = Children.get_english_child()
+
+        prompt = get_child_story_prompt(child, "kindness", language, story_length=3)
+
+        assert child.name in prompt
+        assert str(child.age) in prompt